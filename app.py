@@ -11,15 +11,12 @@ from constants import *
 from menu import Menu
 from queue import PriorityQueue
 
-from copy import deepcopy
-import heapq
-import itertools
+from functools import lru_cache
 from math import ceil
 import os
 import platform
 import random
 import signal
-import sys
 import time
 
 def timeout_handler(signum, frame):
@@ -36,6 +33,32 @@ class ItemRoutingSystem:
     ITEM_SYMBOL         = chr(ord("▣"))
     ORDERED_ITEM_SYMBOL = '‼'
 
+    # Map legend, centered once under the 60 character banner
+    MAP_LEGEND = "\n".join(line.center(60) for line in (
+        "LEGEND:",
+        f"{WORKER_START_SYMBOL}: Worker Starting Spot",
+        f"{WORKER_END_SYMBOL}: Worker Ending Spot",
+        f"{ITEM_SYMBOL}: Item",
+        f"{ORDERED_ITEM_SYMBOL}: Ordered Item",
+        "Positions are labeled as (X, Y)",
+        "X is the horizontal axis, Y is the vertical axis"))
+
+    # Menu choices for the algorithm settings, see choose_setting
+    GATHER_ALGO_OPTIONS = {
+        '1': AlgoMethod.ORDER_OF_INSERTION,
+        '2': AlgoMethod.BRUTE_FORCE,
+        '3': AlgoMethod.DIJKSTRA,
+    }
+    TSP_ALGO_OPTIONS = {
+        '1': AlgoMethod.BRANCH_AND_BOUND,
+        '2': AlgoMethod.LOCALIZED_MIN_PATH,
+        '3': AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR,
+    }
+    TSP_ACCESS_OPTIONS = {
+        '1': AccessType.SINGLE_ACCESS,
+        '2': AccessType.MULTI_ACCESS,
+    }
+
     def __init__(self):
         """
         Initializes ItemRoutingSystem application class.
@@ -52,6 +75,10 @@ class ItemRoutingSystem:
         # Default product info list
         self.product_info = {}
         self.product_file = None
+        self.product_listing = None
+
+        # Parsed product files keyed by file name, along with the file's modification time and size
+        self.product_file_cache = {}
 
         # Default order list
         self.order = []
@@ -85,6 +112,33 @@ class ItemRoutingSystem:
         self.map, self.inserted_order = self.generate_map()
         self.graph = None
 
+        # Default shortest path cache, only valid for the map it was built from
+        self.path_cache = {}
+        self.path_cache_map = None
+        self.blocked_positions = None
+
+        # Default order graph cache, only valid for the map and worker positions it was built from
+        self.graph_cache = {}
+        self.graph_cache_map = None
+        self.graph_cache_positions = None
+
+        # Default order route cache, only valid for the graphs in the order graph cache
+        self.route_cache = {}
+
+        # Menus built by create_menu, keyed by menu type and debug mode
+        self.menus = {}
+
+        # Item positions shown in advanced settings, only valid for the item list it was built from
+        self.item_positions_str = None
+        self.item_positions_items = None
+
+        # Main menu options and their handlers
+        self.option_handlers = {
+            '1': self.handle_view_map,
+            '2': self.handle_settings,
+            '3': self.handle_exit,
+        }
+
         # Display welcome banner
         banner = "------------------------------------------------------------"
         self.log(banner)
@@ -99,6 +153,9 @@ class ItemRoutingSystem:
         """
         Logs information to screen depending on application's debug mode.
 
+        Arguments are only formatted when printed, so frequently called code should
+        pass values as separate arguments instead of building f-strings.
+
         Args:
             *args: Arguments to be printed to screen.
 
@@ -131,13 +188,27 @@ class ItemRoutingSystem:
 
         try:
             self.product_file = product_file_name
-            f = open(product_file_name, 'r')
-            next(f)
 
-            for line in f:
-                fields = line.strip().split()
-                self.product_info[int(fields[0])] = int(float(fields[1])), int(float(fields[2]))
-            f.close()
+            # Reuse the parsed products unless the file changed since it was last loaded
+            stat = os.stat(product_file_name)
+            file_version = (stat.st_mtime_ns, stat.st_size)
+            cached_version, products = self.product_file_cache.get(product_file_name, (None, None))
+
+            if cached_version != file_version:
+                products = {}
+
+                f = open(product_file_name, 'r')
+                next(f)
+
+                for line in f:
+                    fields = line.strip().split()
+                    products[int(fields[0])] = int(float(fields[1])), int(float(fields[2]))
+                f.close()
+
+                self.product_file_cache[product_file_name] = file_version, products
+
+            self.product_info.update(products)
+            self.product_listing = None
 
             # Successfully loaded, reset worker positions
             self.log("Loaded product file, resetting worker positions!")
@@ -158,10 +229,24 @@ class ItemRoutingSystem:
 
         return success, reason
 
+    def log_product_ids(self):
+        """
+        Logs a numbered list of all product IDs.
+
+        The list is built once and reused until another product file is loaded.
+        """
+        if self.product_listing is None:
+            self.product_listing = "\n".join(f"{i}. {product}" for i, product in enumerate(self.product_info, 1))
+
+        self.log("Product IDs:")
+        if self.product_listing:
+            self.log(self.product_listing)
+
     def load_order_file(self, order_file_name):
         success = True
         reason = None
-        original_order_info = deepcopy(self.order_info)
+        # The order list is replaced rather than modified, so it can be restored as is
+        original_order_info = self.order_info
 
         try:
             self.order_file = order_file_name
@@ -237,125 +322,78 @@ class ItemRoutingSystem:
 
         return success, reason
 
-    def display_menu(self, menu_type, clear=True):
+    def create_menu(self, menu_type):
         """
-        Creates and displays the appropriate menu.
+        Creates the menu and its options for a menu type.
 
         Args:
-            menu_type (MenuType): Type of menu to display.
-            clear (bool): Option to clear screen.
-
-        Examples:
-            >>> ItemRoutingSystem.display(MenuType.MAIN_MENU)
-            ------------------------------------------------------------
-                                     Main Menu
-            ------------------------------------------------------------
-
-            1. View Map
-            2. Settings
-            3. Exit
+            menu_type (MenuType): Type of menu to create.
 
+        Returns:
+            menu (Menu): Menu with its options, or None if the menu type has no menu.
         """
         menu = None
 
         if menu_type == MenuType.MAIN_MENU:
             menu = Menu("Main Menu")
-            menu.add_option(1, "View Map")
-            menu.add_option(2, "Settings")
-            menu.add_option(3, "Exit")
+            menu.add_option("View Map")
+            menu.add_option("Settings")
+            menu.add_option("Exit")
 
         elif menu_type == MenuType.VIEW_MAP:
             menu = Menu("View Map Menu")
-            menu.add_option(1, "Create Order")
-            menu.add_option(2, "Get Path for Order")
-            menu.add_option(3, "Get Path to Product")
-            menu.add_option(4, "Get Location of Product")
+            menu.add_option("Create Order")
+            menu.add_option("Get Path for Order")
+            menu.add_option("Get Path to Product")
+            menu.add_option("Get Location of Product")
 
             # Only expose advanced setting option in debug mode
             if self.debug:
-                menu.add_option(5, "Generate New Map")
-                menu.add_option(6, "Back")
+                menu.add_option("Generate New Map")
+                menu.add_option("Back")
             else:
-                menu.add_option(5, "Back")
+                menu.add_option("Back")
 
         elif menu_type == MenuType.CREATE_ORDER:
             menu = Menu("Create Order")
-            menu.add_option(1, "Individual Order")
-            menu.add_option(2, "Multiple Orders From File")
-            menu.add_option(3, "Back")
+            menu.add_option("Individual Order")
+            menu.add_option("Multiple Orders From File")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.MULTIPLE_ORDERS:
             menu = Menu("Multiple Orders")
-            menu.add_option(1, "Load New Order File")
-            menu.add_option(2, f"Continue to Next Order (Currently {self.order_number})")
-            menu.add_option(3, "Choose Order")
-            menu.add_option(4, "Back")
+            menu.add_option("Load New Order File")
+            menu.add_option(f"Continue to Next Order (Currently {self.order_number})")
+            menu.add_option("Choose Order")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.SETTINGS:
             menu = Menu("Settings Menu")
-            menu.add_option(1, "Load Product File")
-            menu.add_option(2, "Set Worker Starting Position Mode")
-            menu.add_option(3, "Set Worker Ending Position Mode")
-            menu.add_option(4, "Set Maximum Items Ordered")
-            menu.add_option(5, "Set Maximum Routing Time")
-            menu.add_option(6, "Toggle Debug Mode")
+            menu.add_option("Load Product File")
+            menu.add_option("Set Worker Starting Position Mode")
+            menu.add_option("Set Worker Ending Position Mode")
+            menu.add_option("Set Maximum Items Ordered")
+            menu.add_option("Set Maximum Routing Time")
+            menu.add_option("Toggle Debug Mode")
 
             if self.debug:
-                menu.add_option(7, "Advanced Settings")
-                menu.add_option(8, "Back")
+                menu.add_option("Advanced Settings")
+                menu.add_option("Back")
 
             else:
-                menu.add_option(7, "Back")
-
-            info = "Current Settings:\n" \
-                   f"  Loaded Product File: {self.product_file}\n" \
-                   f"  Worker Settings:\n" \
-                   f"   Starting Position: {self.starting_position}\n" \
-                   f"   Ending Position: {self.ending_position}\n" \
-                   f"  Maximum Routing Time: {self.maximum_routing_time}\n" \
-                   f"  Debug Mode: {self.debug}\n"
-
-            menu.set_misc_info(info)
+                menu.add_option("Back")
 
         elif menu_type == MenuType.ADVANCED_SETTINGS:
             menu = Menu("Advanced Settings Menu")
-            menu.add_option(1, "Set Map Size")
-            menu.add_option(2, "Set Item Position Mode")
-            menu.add_option(3, "Set Map Orientation")
-            menu.add_option(4, "Set Gathering Algorithm")
-            menu.add_option(5, "Set TSP Algorithm")
-            menu.add_option(6, "Set TSP Access Type")
-            menu.add_option(7, "Load Test Case File")
-            menu.add_option(8, "Run Test Cases")
-            menu.add_option(9, "Back")
-
-            position_str = ' '.join(str(p) for p in self.items)
-            if len(self.items) > 10:
-                file = "positions.txt"
-
-                # Write positions to file if too many to print to screen
-                with open(file, "w+") as f:
-                    for position in self.items:
-                        x, y = position
-                        f.write(f"({x}, {y})\n")
-
-                position_str = f"See '{file}' for list of item positions."
-
-            info = "Current Advanced Settings:\n" \
-                   f"Map Size: {self.map_x}x{self.map_y}\n" \
-                   f"\n" \
-                   f"Worker Settings:\n" \
-                   f"  Mode: {self.worker_mode}\n" \
-                   f"  Gathering Algorithm: {self.gathering_algo}\n" \
-                   f"  TSP Algorithm: {self.tsp_algorithm}\n" \
-                   f"  TSP Access Type: {self.bnb_access_type}\n" \
-                   f"Item Settings:\n" \
-                   f"  Mode: {self.item_mode}\n" \
-                   f"  Number of Items: {len(self.items)}\n" \
-                   f"  Positions: {position_str}\n" \
-                   f"Debug Mode: {self.debug}\n"
-
-            menu.set_misc_info(info)
+            menu.add_option("Set Map Size")
+            menu.add_option("Set Item Position Mode")
+            menu.add_option("Set Map Orientation")
+            menu.add_option("Set Gathering Algorithm")
+            menu.add_option("Set TSP Algorithm")
+            menu.add_option("Set TSP Access Type")
+            menu.add_option("Load Test Case File")
+            menu.add_option("Run Test Cases")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.LOAD_PRODUCT_FILE:
             menu = Menu("Load Product File Menu")
@@ -365,45 +403,124 @@ class ItemRoutingSystem:
 
         elif menu_type == MenuType.GATHER_ALGO_METHOD:
             menu = Menu("Set Gathering Algorithm")
-            menu.add_option(1, "Use Order of Insertion")
-            menu.add_option(2, "Brute Force")
-            menu.add_option(3, "Dijkstra")
-            menu.add_option(4, "Back")
+            menu.add_option("Use Order of Insertion")
+            menu.add_option("Brute Force")
+            menu.add_option("Dijkstra")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.TSP_ALGO_METHOD:
             menu = Menu("Set TSP Algorithm")
-            menu.add_option(1, "Branch and Bound")
-            menu.add_option(2, "Localized Minimum Path")
-            menu.add_option(3, "Repetitive Nearest Neighbor")
-            menu.add_option(4, "Back")
+            menu.add_option("Branch and Bound")
+            menu.add_option("Localized Minimum Path")
+            menu.add_option("Repetitive Nearest Neighbor")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.TSP_ACCESS_TYPE:
             menu = Menu("Set TSP Access Type")
-            menu.add_option(1, "Single Access Point")
-            menu.add_option(2, "Multi Access Point")
-            menu.add_option(3, "Back")
+            menu.add_option("Single Access Point")
+            menu.add_option("Multi Access Point")
+            menu.add_option("Back")
 
         elif menu_type == MenuType.WORKER_START_POSITION:
             menu = Menu("Set Starting Worker Position Mode")
 
             if self.debug:
-                menu.add_option(1, "Randomly Set Position")
-                menu.add_option(2, "Manually Set Position")
-                menu.add_option(3, "Back")
+                menu.add_option("Randomly Set Position")
+                menu.add_option("Manually Set Position")
+                menu.add_option("Back")
 
         elif menu_type == MenuType.WORKER_ENDING_POSITION:
             menu = Menu("Set Ending Worker Position Mode")
 
             if self.debug:
-                menu.add_option(1, "Randomly Set Position")
-                menu.add_option(2, "Manually Set Position")
-                menu.add_option(3, "Back")
+                menu.add_option("Randomly Set Position")
+                menu.add_option("Manually Set Position")
+                menu.add_option("Back")
 
         elif menu_type == MenuType.ITEM_POSITION:
             menu = Menu("Set Item Position Mode")
-            menu.add_option(1, "Randomly Set Position")
-            menu.add_option(2, "Manually Set Position")
-            menu.add_option(3, "Back")
+            menu.add_option("Randomly Set Position")
+            menu.add_option("Manually Set Position")
+            menu.add_option("Back")
+
+        return menu
+
+    def display_menu(self, menu_type, clear=True):
+        """
+        Creates and displays the appropriate menu.
+
+        Args:
+            menu_type (MenuType): Type of menu to display.
+            clear (bool): Option to clear screen.
+
+        Examples:
+            >>> ItemRoutingSystem.display(MenuType.MAIN_MENU)
+            ------------------------------------------------------------
+                                     Main Menu
+            ------------------------------------------------------------
+
+            1. View Map
+            2. Settings
+            3. Exit
+
+        """
+        # Options only depend on the menu type and debug mode, so menus are built once
+        key = (menu_type, self.debug)
+        menu = self.menus.get(key)
+
+        if menu is None:
+            menu = self.create_menu(menu_type)
+
+            # Continue option shows the current order number, so it is rebuilt every time
+            if menu_type != MenuType.MULTIPLE_ORDERS:
+                self.menus[key] = menu
+
+        if menu_type == MenuType.SETTINGS:
+            info = "Current Settings:\n" \
+                   f"  Loaded Product File: {self.product_file}\n" \
+                   f"  Worker Settings:\n" \
+                   f"   Starting Position: {self.starting_position}\n" \
+                   f"   Ending Position: {self.ending_position}\n" \
+                   f"  Maximum Routing Time: {self.maximum_routing_time}\n" \
+                   f"  Debug Mode: {self.debug}\n"
+
+            menu.set_misc_info(info)
+
+        elif menu_type == MenuType.ADVANCED_SETTINGS:
+            # Items are replaced rather than changed, so positions are only rendered for a new list
+            if self.item_positions_items is not self.items:
+                position_str = ' '.join(str(p) for p in self.items)
+                if len(self.items) > 10:
+                    file = "positions.txt"
+
+                    # Write positions to file if too many to print to screen
+                    with open(file, "w+") as f:
+                        for position in self.items:
+                            x, y = position
+                            f.write(f"({x}, {y})\n")
+
+                    position_str = f"See '{file}' for list of item positions."
+
+                self.item_positions_str = position_str
+                self.item_positions_items = self.items
+
+            position_str = self.item_positions_str
+
+            info = "Current Advanced Settings:\n" \
+                   f"Map Size: {self.map_x}x{self.map_y}\n" \
+                   f"\n" \
+                   f"Worker Settings:\n" \
+                   f"  Mode: {self.worker_mode}\n" \
+                   f"  Gathering Algorithm: {self.gathering_algo}\n" \
+                   f"  TSP Algorithm: {self.tsp_algorithm}\n" \
+                   f"  TSP Access Type: {self.bnb_access_type}\n" \
+                   f"Item Settings:\n" \
+                   f"  Mode: {self.item_mode}\n" \
+                   f"  Number of Items: {len(self.items)}\n" \
+                   f"  Positions: {position_str}\n" \
+                   f"Debug Mode: {self.debug}\n"
+
+            menu.set_misc_info(info)
 
         if menu:
             menu.display(clear=clear)
@@ -474,6 +591,32 @@ class ItemRoutingSystem:
 
         return grid, inserted_order
 
+    def update_worker_position(self, previous_position):
+        """
+        Updates the map after a worker position changed, redrawing only the affected
+        positions instead of generating the map again.
+
+        Positions are drawn the same way `generate_map` draws them, with items placed
+        over worker positions. Item positions never change here, which keeps the
+        cached paths for the map valid.
+
+        Args:
+            previous_position (tuple): Worker position before it was changed.
+        """
+        items = set(self.inserted_order)
+
+        for position in [previous_position, self.starting_position, self.ending_position]:
+            x, y = position
+
+            if position in items:
+                self.map[x][y] = ItemRoutingSystem.ITEM_SYMBOL
+            elif position == self.starting_position:
+                self.map[x][y] = ItemRoutingSystem.WORKER_START_SYMBOL
+            elif position == self.ending_position:
+                self.map[x][y] = ItemRoutingSystem.WORKER_END_SYMBOL
+            else:
+                self.map[x][y] = '_'
+
     def display_map(self, map_layout=None, map_only=False):
         """
         Prints map to screen with a legend. Map will be centered within the
@@ -522,30 +665,23 @@ class ItemRoutingSystem:
                     col.append(map_layout[x][y])
             grid.append(col)
 
-        for i, col in zip(reversed(range(len(grid))), grid):
-            row_string = f"{i:2} "
-
-            for j, val in enumerate(col):
-                row_string += val + " " * len(str(j))
+        # Spacing after a cell only depends on its column, so it is shared by every row
+        spacing = [" " * len(str(j)) for j in range(len(grid[0]))]
 
-            self.log(row_string.center(banner_length))
+        # Rows are gathered and written to the screen at once
+        lines = []
+        for i, col in zip(reversed(range(len(grid))), grid):
+            row_string = f"{i:2} " + "".join(val + space for val, space in zip(col, spacing))
+            lines.append(row_string.center(banner_length))
 
         left_spacing = len(str(i)) + 2
-        self.log(f"{' ':{left_spacing}}" + " ".join(str(i) for i in range(len(map_layout))).center(banner_length))
+        lines.append(f"{' ':{left_spacing}}" + " ".join(str(i) for i in range(len(map_layout))).center(banner_length))
 
-        if not map_only:
+        self.log("\n".join(lines))
 
-            self.log("")
-            self.log("LEGEND:".center(banner_length))
-            self.log(f"{ItemRoutingSystem.WORKER_START_SYMBOL}: Worker Starting Spot".center(banner_length))
-            self.log(f"{ItemRoutingSystem.WORKER_END_SYMBOL}: Worker Ending Spot".center(banner_length))
-            self.log(f"{ItemRoutingSystem.ITEM_SYMBOL}: Item".center(banner_length))
-            self.log(f"{ItemRoutingSystem.ORDERED_ITEM_SYMBOL}: Ordered Item".center(banner_length))
-            self.log("Positions are labeled as (X, Y)".center(banner_length))
-            self.log("X is the horizontal axis, Y is the vertical axis".center(banner_length))
-            self.log("")
-            self.log("Missing Worker Ending Spot means it overlaps with Starting Spot")
-            self.log("")
+        if not map_only:
+            self.log(f"\n{ItemRoutingSystem.MAP_LEGEND}\n\n"
+                     "Missing Worker Ending Spot means it overlaps with Starting Spot\n")
 
             settings_info = "Current Settings:\n" \
                             f"  Worker Settings:\n" \
@@ -572,10 +708,9 @@ class ItemRoutingSystem:
     def display_path_in_map(self, steps, map_layout=None, map_only=False):
         path = []
 
+        # Draw on a copy of the map, cells are strings so copying each row is enough
         if map_layout is None:
-            map_layout = self.map
-
-        original_map = deepcopy(self.map)
+            map_layout = [row[:] for row in self.map]
 
         for step in steps:
             # From (0, 5), move right 10 to (10, 5).
@@ -677,14 +812,31 @@ class ItemRoutingSystem:
 
         self.display_map(map_layout=map_layout, map_only=map_only)
 
-        # Restore Original Map
-        self.map = deepcopy(original_map)
+    def log_directions(self, steps):
+        """
+        Logs numbered directions for a path, gathered into a single write to the screen.
+
+        Args:
+            steps (list of str): Descriptive steps of the path, ending with the total steps.
+        """
+        lines = ["Directions:", "-----------"]
+        for step, action in enumerate(steps, 1):
+            if "Total Steps" in action:
+                lines.append(action)
+            else:
+                lines.append(f"{step}. {action}")
+
+        self.log("\n".join(lines))
 
-    def move_to_target(self, start, end):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def move_to_target(start, end):
         """
         Helper function to evaluate moves to make between a start and end
         position.
 
+        Moves only depend on the two positions, so results are cached.
+
         Args:
             start (tuple): Starting position specified as (X, Y) position.
             end   (tuple): End position to move to specified as (X, Y) position.
@@ -697,38 +849,25 @@ class ItemRoutingSystem:
             >>> ItemRoutingSystem.move_to_target((0, 0), (2, 0))
             "From (0, 0), move right 2 to (2, 0).", (2, 0)
         """
-        current_position = start
-        x_done = y_done = False
         x_direction = y_direction = None
-        x_diff = y_diff = 0
-
-        # Move X position
-        if current_position[0] != end[0]:
-            x_diff = end[0] - current_position[0]
-
-            # Move Left
-            if x_diff < 0:
-                x_position = (current_position[0] - x_diff, current_position[1])
-                x_direction = "left"
+        x_diff = end[0] - start[0]
+        y_diff = end[1] - start[1]
 
-            # Move Right
-            elif x_diff > 0:
-                x_position = (current_position[0] + x_diff, current_position[1])
-                x_direction = "right"
+        # Move Left
+        if x_diff < 0:
+            x_direction = "left"
 
-        # Move Y position
-        if current_position[1] != end[1]:
-            y_diff = end[1] - current_position[1]
+        # Move Right
+        elif x_diff > 0:
+            x_direction = "right"
 
-            # Move Up
-            if y_diff < 0:
-                y_position = (current_position[0], current_position[1] - y_diff)
-                y_direction = "down"
+        # Move Down
+        if y_diff < 0:
+            y_direction = "down"
 
-            # Move Down
-            elif y_diff > 0:
-                y_position = (current_position[0], current_position[1] + y_diff)
-                y_direction = "up"
+        # Move Up
+        elif y_diff > 0:
+            y_direction = "up"
 
         move = f"From {start}"
         if x_direction and y_direction:
@@ -773,6 +912,20 @@ class ItemRoutingSystem:
 
             return is_in_bounds and is_open_position
 
+        # Graphs are cached until the map or worker positions change. In-place map edits
+        # never change item positions (see dijkstra_multi), and worker moves are caught
+        # by the position check.
+        positions = (self.starting_position, self.ending_position)
+        if self.map is not self.graph_cache_map or positions != self.graph_cache_positions:
+            self.graph_cache = {}
+            self.graph_cache_map = self.map
+            self.graph_cache_positions = positions
+            self.route_cache = {}
+
+        cached = self.graph_cache.get(tuple(product_ids))
+        if cached is not None:
+            return cached
+
         # Initialize Graph with End -> Start node of cost 0
         graph = {
             ('End', 'Start', None): {
@@ -799,7 +952,7 @@ class ItemRoutingSystem:
                    start == "End" or \
                    end == "Start" or \
                    start == "Start" and end == "End":
-                    self.log(f"Skipping pair: {start, end}", print_type=PrintType.MINOR)
+                    self.log("Skipping pair:", (start, end), print_type=PrintType.MINOR)
                     continue
 
                 for start_dir in directions:
@@ -820,7 +973,7 @@ class ItemRoutingSystem:
 
                         # Don't add invalid position
                         if not is_valid_position(x, y):
-                            self.log(f"Invalid access point position: {x, y}", print_type=PrintType.MINOR)
+                            self.log("Invalid access point position:", (x, y), print_type=PrintType.MINOR)
                             continue
 
                         # Add valid positions & get path
@@ -833,7 +986,7 @@ class ItemRoutingSystem:
                                 start_y = self.product_info[start][1] + directions[start_dir][1]
 
                                 if not is_valid_position(start_x, start_y):
-                                    self.log(f"({start_x}, {start_y}) Not a VALID STARTING POSITION", print_type=PrintType.MINOR)
+                                    self.log((start_x, start_y), "Not a VALID STARTING POSITION", print_type=PrintType.MINOR)
                                     continue
 
                                 start_position = (start_x, start_y)
@@ -845,28 +998,24 @@ class ItemRoutingSystem:
 
                             valid_directions[end_dir] = {
                                 "location": (x, y),
-                                "cost": cost,
+                                "cost": INFINITY if cost is None else cost,
                                 "path": updated_path
                             }
 
                     if valid_directions:
                         graph[(start, end, start_dir)] = valid_directions
 
+        self.graph_cache[tuple(product_ids)] = graph
+
         return graph
 
     def print_matrix(self, matrix):
-        print_matrix = {}
-
-        for key, val in matrix.items():
-            temp_val = deepcopy(val)
-            for k, v in temp_val.items():
-                if "path" in v:
-                    v.pop("location")
-                    v.pop("path")
-                # v.pop()
-            print_matrix[str(key)] = temp_val
-        # self.log(print_matrix)
-        return print_matrix
+        """
+        Projects the cost of each access point out of a graph for printing.
+
+        Only the costs are read, so the graph is not copied.
+        """
+        return {str(key): {direc: v['cost'] for direc, v in val.items()} for key, val in matrix.items()}
 
     def matrix_reduction(self, matrix, source=None, dest=None):
         """
@@ -874,72 +1023,96 @@ class ItemRoutingSystem:
         Returns a reduced matrix
         """
         global INCREMENT
-        temp_matrix = deepcopy(matrix)
+
+        # Only costs are changed, so each access point gets a new dictionary
+        # while the paths are shared with the input matrix
+        temp_matrix = {k: {direc: dict(values) for direc, values in v.items()} for k, v in matrix.items()}
         reduction_cost = 0
 
-        # when taking a path, set the corresponding row nad column to inf
-        if source:
-            for k,v in temp_matrix.items():
-                if (source[0] == k[0]):
-                    for direc in v:
-                        v[direc]['cost'] = INFINITY
-                if (source[1] == k[1]):
-                    for direc in v:
-                        v[direc]['cost'] = INFINITY
+        # Minimum costs of each row, kept separately for the 'End' column.
+        # [minimum cost, minimum 'End' cost, row reduction, 'End' reduction]
+        rows = {}
 
-                self.log("Source set to Infinity", print_type=PrintType.MINOR)
-                # print_matrix(temp_matrix)
+        for k,v in temp_matrix.items():
+            # when taking a path, set the corresponding row nad column to inf
+            if source and (source[0] == k[0] or source[1] == k[1]):
+                for direc in v:
+                    v[direc]['cost'] = INFINITY
 
+            row = rows.setdefault(k[0], [INFINITY, INFINITY, 0, 0])
+            index = 1 if ('End' == k[1]) else 0
+            for direc in v:
+                row[index] = min(row[index], v[direc]['cost'])
+
+        if source:
+            self.log("Source set to Infinity", print_type=PrintType.MINOR)
+
+        # Total reduction of the zero col, rows only take the part applied
+        # while reducing other rows
+        col_reduction = 0
 
         # Finds the minimum value to make a row have a zero
         for key in temp_matrix.keys():
-            row_cost = INFINITY
-            zero_col_cost = INFINITY
+            row_min, row_end_min, row_reduction, row_end_reduction = rows[key[0]]
 
-            for k,v in temp_matrix.items():
-                if (key[0] == k[0]):
-                    for direc in v:
-                        direc_cost = INFINITY if (v.get(direc).get('cost') is None) else v.get(direc).get('cost')
-                        row_cost = min(row_cost, direc_cost)
+            row_cost = min(row_min, row_end_min - (col_reduction - row_end_reduction)) - row_reduction
 
-                # minimum zero col
-                elif ('End' == k[1]):
-                    for direc in v:
-                        zero_direc_cost = INFINITY if (v.get(direc).get('cost') is None) else v.get(direc).get('cost')
-                        zero_col_cost = min(zero_col_cost, zero_direc_cost)
+            # minimum zero col
+            zero_col_cost = INFINITY
+            for node, (_, end_min, reduction, end_reduction) in rows.items():
+                if (key[0] != node):
+                    zero_col_cost = min(zero_col_cost, end_min - reduction - (col_reduction - end_reduction))
 
             if (row_cost == INFINITY):
                 row_cost = 0;
             if (zero_col_cost == INFINITY):
                 zero_col_cost = 0;
 
-            # reduces the values in the matrix
-            for k,v in temp_matrix.items():
-                if (key[0] == k[0]):
-                    for direc in v:
-                        if (v.get(direc).get('cost') is None or v.get(direc).get('cost') == INFINITY):
-                            v[direc]['cost'] = INFINITY
-                        else:
-                            v[direc]['cost'] = (v.get(direc).get('cost') - row_cost)
-
-                # zero col zeroing
-                elif ('End' == k[1]):
-                    for direc in v:
-                        if (v.get(direc).get('cost') is None or v.get(direc).get('cost') == INFINITY):
-                            v[direc]['cost'] = INFINITY
-                        else:
-                            v[direc]['cost'] = (v.get(direc).get('cost') - zero_col_cost)
+            rows[key[0]][2] += row_cost
+            rows[key[0]][3] += zero_col_cost
+            col_reduction += zero_col_cost
 
             if (row_cost != 0):
-                self.log(f"Row: {row_cost}", print_type=PrintType.MINOR)
+                self.log("Row:", row_cost, print_type=PrintType.MINOR)
 
             reduction_cost += row_cost + zero_col_cost
 
+        # reduces the values in the matrix
+        for k,v in temp_matrix.items():
+            _, _, reduction, end_reduction = rows[k[0]]
+
+            # zero col zeroing
+            if ('End' == k[1]):
+                reduction += col_reduction - end_reduction
+
+            for direc in v:
+                if v[direc]['cost'] != INFINITY:
+                    v[direc]['cost'] -= reduction
+
         self.log("Final Child", print_type=PrintType.MINOR)
-        self.log(f"Reduction Cost: {reduction_cost}", print_type=PrintType.MINOR)
+        self.log("Reduction Cost:", reduction_cost, print_type=PrintType.MINOR)
         return reduction_cost, temp_matrix
 
 
+    def get_edges_by_source(self, graph):
+        """
+        Groups graph keys by their source node and source access point, so algorithms
+        can look up the edges leaving a node without walking the entire graph.
+
+        Args:
+            graph (dict): Graph of access point costs keyed by (source, dest, source_direction).
+
+        Returns:
+            edges (dict): Graph keys in graph order, keyed by (source, source_direction).
+        """
+        edges = {}
+
+        for key in graph:
+            start, dest, src_dir = key
+            edges.setdefault((start, src_dir), []).append(key)
+
+        return edges
+
     def branch_and_bound(self, graph, order):
         """
         Applies the branch and bound algorithm to generate a path
@@ -979,11 +1152,13 @@ class ItemRoutingSystem:
         try:
             # 1. Create Matrix
             # 2. Reduction
+            # Reduced matrices are never modified after they are made, so they are shared between nodes
             reduced_cost, parent_matrix = self.matrix_reduction(graph)
-            child_matrix = deepcopy(parent_matrix)
+            child_matrix = parent_matrix
 
             # 3. Choose Random Start
-            start_node, dest_node, start_dir = random.choice( list(graph) )
+            start_node, dest_node, start_dir = random.choice(tuple(graph))
+            edges = self.get_edges_by_source(graph)
 
             # 4. Set Upper Bound
             upper_bound = order
@@ -1028,67 +1203,68 @@ class ItemRoutingSystem:
                         final_path = src_path
                         minimum_cost = total_final_reduction
 
-                for (start, dest, src_dir), access_points in matrix.items():
-                    # Ignore other irrelevant entries
-                    if source == start and source_direction == src_dir:
+                for (start, dest, src_dir) in edges.get((source, source_direction), []):
+                    access_points = matrix[(start, dest, src_dir)]
 
-                        # Check if destination is already in path
-                        found = False
-                        for node in src_path:
-                            if dest == node[0]:
-                                found = True
-                                break
 
-                        if found:
-                            continue
+                    # Check if destination is already in path
+                    found = False
+                    for node in src_path:
+                        if dest == node[0]:
+                            found = True
+                            break
 
-                        child_path = []
+                    if found:
+                        continue
 
-                        if self.bnb_access_type == AccessType.SINGLE_ACCESS:
-                            highest_reduction = INFINITY
-                            chosen_start = chosen_direc = None
-                            chosen_matrix = None
+                    child_path = []
 
-                        for direc in access_points:
-                            if access_points[direc].get('cost') is None or (access_points[direc].get('cost') == INFINITY):
-                                continue
+                    if self.bnb_access_type == AccessType.SINGLE_ACCESS:
+                        highest_reduction = INFINITY
+                        chosen_start = chosen_direc = None
+                        chosen_matrix = None
 
-                            if (str(src_path), dest) in cached_matrices:
-                                reduction, temp_matrix = cached_matrices[(str(src_path), dest)]
+                    for direc in access_points:
+                        if access_points[direc]['cost'] == INFINITY:
+                            continue
 
-                            else:
-                                reduction, temp_matrix = self.matrix_reduction( matrix, (start, dest, src_dir), direc )
-                                cached_matrices[(str(src_path), dest)] = (reduction, temp_matrix)
+                        if (str(src_path), dest) in cached_matrices:
+                            reduction, temp_matrix = cached_matrices[(str(src_path), dest)]
 
-                            total_reduction = cost + access_points[direc].get('cost') + reduction
+                        else:
+                            reduction, temp_matrix = self.matrix_reduction( matrix, (start, dest, src_dir), direc )
+                            cached_matrices[(str(src_path), dest)] = (reduction, temp_matrix)
 
-                            if self.bnb_access_type == AccessType.SINGLE_ACCESS:
-                                # Filter for minimum Single Access Point
-                                if chosen_start is None or total_reduction < highest_reduction:
-                                    chosen_start = dest
-                                    chosen_direc = direc
-                                    highest_reduction = total_reduction
-                                    chosen_matrix = deepcopy(temp_matrix)
+                        total_reduction = cost + access_points[direc]['cost'] + reduction
 
-                                    child_path = src_path + [(dest, direc)]
+                        if self.bnb_access_type == AccessType.SINGLE_ACCESS:
+                            # Filter for minimum Single Access Point
+                            if chosen_start is None or total_reduction < highest_reduction:
+                                chosen_start = dest
+                                chosen_direc = direc
+                                highest_reduction = total_reduction
+                                chosen_matrix = temp_matrix
 
-                            elif self.bnb_access_type == AccessType.MULTI_ACCESS:
                                 child_path = src_path + [(dest, direc)]
-                                node_to_visit = (dest, direc, total_reduction, deepcopy(temp_matrix), child_path)
-
-                                if (total_reduction) <= minimum_cost:
 
-                                    index = binary_search(queue, 0, len(queue) - 1, total_reduction)
-                                    queue.insert(index, node_to_visit)
+                        elif self.bnb_access_type == AccessType.MULTI_ACCESS:
+                            child_path = src_path + [(dest, direc)]
 
-
-                        if self.bnb_access_type == AccessType.SINGLE_ACCESS and child_path:
-                            node_to_visit = (chosen_start, chosen_direc, total_reduction, chosen_matrix, child_path)
+                            node_to_visit = (dest, direc, total_reduction, temp_matrix, child_path)
 
                             if (total_reduction) <= minimum_cost:
+
                                 index = binary_search(queue, 0, len(queue) - 1, total_reduction)
                                 queue.insert(index, node_to_visit)
 
+
+                    if self.bnb_access_type == AccessType.SINGLE_ACCESS and child_path:
+                        node_to_visit = (chosen_start, chosen_direc, total_reduction, chosen_matrix, child_path)
+
+                        if (total_reduction) <= minimum_cost:
+                            index = binary_search(queue, 0, len(queue) - 1, total_reduction)
+                            queue.insert(index, node_to_visit)
+
         # Algorithm Timed out, return
         except TimeoutError as exc:
             # Algorithm timed out, return input order list
@@ -1133,13 +1309,11 @@ class ItemRoutingSystem:
                 if product_id == 'End':
                     break
 
-                node_minimum_cost = float('inf')
+                node_minimum_cost = INFINITY
 
                 # calculate the node min cost in different directions
                 for direction, values in graph[('Start', product_id, None)].items():
                     cost = values["cost"]
-                    if cost is None:
-                        break
                     if cost < node_minimum_cost:
                         node_minimum_cost = cost
 
@@ -1151,12 +1325,10 @@ class ItemRoutingSystem:
                     index = -1
                     for i in range(n):
                         compared_node = sorted_order[i]
-                        compared_minimum_cost = float('inf')
+                        compared_minimum_cost = INFINITY
                         # get the compared node minimum cost
                         for direction, values in graph[('Start', compared_node, None)].items():
                             cost = values["cost"]
-                            if cost is None:
-                                break
                             if cost < compared_minimum_cost:
                                 compared_minimum_cost = cost
                         # if current node cost is less, insert
@@ -1180,19 +1352,17 @@ class ItemRoutingSystem:
                     path += [('Start', None)]
                     continue
 
-                min_cost = float('inf')
+                min_cost = INFINITY
                 shortest_path = []
 
                 # Choose one of the access points, and get the shortest path
                 for access_point, val in graph[(pre_node, product_id, access_direction)].items():
-                    if val['cost'] is None:
-                        break
-                    if min_cost is None or val['cost'] < min_cost:
+                    if val['cost'] < min_cost:
                         min_cost = val['cost']
                         access_direction = access_point
                         shortest_path = [(product_id, access_point)]
 
-                if min_cost != float('inf'):
+                if min_cost != INFINITY:
                     total_cost += min_cost
                 path += shortest_path
                 pre_node = product_id
@@ -1221,7 +1391,7 @@ class ItemRoutingSystem:
             if len(left_item) > 1:
                 left_node, left_dir = left_item
                 right_node, right_dir = right_item
-                self.log(f"Getting Location for {left_node, left_dir} -> {right_node, right_dir}", print_type=PrintType.MINOR)
+                self.log("Getting Location for", (left_node, left_dir), "->", (right_node, right_dir), print_type=PrintType.MINOR)
                 locations += graph[(left_node, right_node, left_dir)][right_dir]["path"]
 
         return locations
@@ -1310,17 +1480,24 @@ class ItemRoutingSystem:
         signal.alarm(ceil(self.maximum_routing_time))
 
         try:
-            # create a path for every single starting node
-            for key in graph.keys():
+            edges = self.get_edges_by_source(graph)
+
+            # Number of visits left for each node, since a product may be ordered more than once
+            visits = {}
+            for node in order:
+                visits[node] = visits.get(node, 0) + 1
+
+            # create a path for every single starting node, each node and direction
+            # is a source of several graph edges but only needs one path
+            for first_node in edges:
                 first_time_thru = True
                 queue = []
-                item_list = order.copy()
-                first_node = (key[0], key[2])
+                item_list = visits.copy()
                 queue.append(first_node)
                 total_cost = 0;
 
                 while item_list:
-                    popped_node = queue[-1:]
+                    popped_node = queue[-1]
 
                     # first time through, set the starting node as unvisited, used for cycling
                     if (first_time_thru):
@@ -1330,23 +1507,20 @@ class ItemRoutingSystem:
                     next_node = None
                     visited_next_node = None
 
-                    for (curr_node, dest_node, curr_dir), values in graph.items():
+                    for (curr_node, dest_node, curr_dir) in edges.get(popped_node, []):
+                        values = graph[(curr_node, dest_node, curr_dir)]
 
                         # there exists an unvisited node, prioritize it
-                        if ( popped_node[0][0] == curr_node and popped_node[0][1] == curr_dir and (dest_node in item_list) ):
+                        if (dest_node in item_list):
                             for direc in values:
-                                if (values[direc]['cost'] is None):
-                                    continue
-                                elif (min_cost > values[direc]['cost']):
+                                if (min_cost > values[direc]['cost']):
                                     min_cost = values[direc]['cost']
                                     next_node = (dest_node, direc)
 
                         # all nodes are visited, choose the least cost of the visited nodes
-                        elif ( popped_node[0][0] == curr_node and popped_node[0][1] == curr_dir ):
+                        else:
                             for direc in values:
-                                if (values[direc]['cost'] is None):
-                                    continue
-                                elif (visited_min_cost > values[direc]['cost']):
+                                if (visited_min_cost > values[direc]['cost']):
                                     visited_min_cost = values[direc]['cost']
                                     visited_next_node = (dest_node, direc)
 
@@ -1357,7 +1531,9 @@ class ItemRoutingSystem:
                             total_cost += min_cost
                         queue.append(next_node)
                         if next_node[0] in item_list:
-                            item_list.remove(next_node[0])
+                            item_list[next_node[0]] -= 1
+                            if not item_list[next_node[0]]:
+                                del item_list[next_node[0]]
                     else:
                         if not first_time_thru:
                             total_cost += visited_min_cost
@@ -1375,9 +1551,10 @@ class ItemRoutingSystem:
                 elif beginning_node[0] == "Start" and last_node[0] != "End":
                     total_cost += graph[ ( last_node[0], "End", last_node[1])][ beginning_node[1] ][ 'cost' ]
 
-                # a path completed, save it as a path based on least cost
+                # a path completed, save it as a path based on least cost, each starting
+                # node builds a new queue so the path doesn't need to be copied
                 if (final_cost > total_cost):
-                    final_path = queue.copy()
+                    final_path = queue
                     final_cost = total_cost
 
         # Algorithm Timed out, return
@@ -1386,7 +1563,7 @@ class ItemRoutingSystem:
             self.log(exc)
             signal.alarm(0)
 
-            if path:
+            if final_path:
                 return final_cost, final_path
             else:
                 return None, order
@@ -1396,8 +1573,13 @@ class ItemRoutingSystem:
 
     def gather_brute_force(self, targets):
         """
-        Performs brute force algorithm to gather all valid permutations of desired path then
-        finds shortest path.
+        Finds the shortest path from the first target through every other target, ending at
+        the last target.
+
+        Instead of trying every permutation, the shortest remaining distance is computed once
+        for each set of unvisited targets (Held-Karp), which takes O(n^2 * 2^n) time instead
+        of O(n!). When several paths are equally short, the same path as trying every
+        permutation in order is returned.
 
         Args:
             targets (list of tuples): Positions of item.
@@ -1405,45 +1587,58 @@ class ItemRoutingSystem:
         Returns:
             min_path (list of tuples): List of item positions to traverse in order.
         """
+        # With at most one target between the first and last, there is only one path
+        if len(targets) <= 3:
+            return list(targets)
+
         if self.debug:
             start_time = time.time()
 
-        smallest = None
-        min_path = None
+        # Distance between every pair of targets
+        distances = [[abs(x1 - x2) + abs(y1 - y2) for (x2, y2) in targets] for (x1, y1) in targets]
+        last = len(targets) - 1
 
-        result = []
-        nodes = targets.copy()
-        start = nodes.pop(0)
-        end = nodes.pop()
-
-        paths = []
-        for node in itertools.permutations(nodes):
-            temp_path = list(node)
-            temp_path.insert(0, start)
-            temp_path.append(end)
-            paths.append(temp_path)
-
-        for path in paths:
-            distance = 0
-            for i in range(len(path)):
-                j = i + 1
+        # Targets between the first and last are visited in any order, target i is bit (i - 1)
+        middle = range(1, last)
+        all_visited = (1 << len(middle)) - 1
 
-                if j < len(path):
-                    distance += abs(path[i][0] - path[j][0])
-                    distance += abs(path[i][1] - path[j][1])
+        # remaining[unvisited][i]: shortest distance from target i through every unvisited
+        # target to the last target. Removing a target gives a smaller set, so sets are
+        # computed in increasing order.
+        remaining = [[0] * len(targets) for _ in range(all_visited + 1)]
+        for i in range(last):
+            remaining[0][i] = distances[i][last]
 
-                    self.log(f"Path[i]: {path[i]} " \
-                             f"Path[j]: {path[j]} " \
-                             f"X Diff: {abs(path[i][0] - path[j][0])} " \
-                             f"Y Diff: {abs(path[i][1] - path[j][1])} " \
-                             f"Distance: {distance}",
-                             print_type=PrintType.DEBUG)
+        for unvisited in range(1, all_visited + 1):
+            for i in range(last):
+                if i and unvisited & (1 << (i - 1)):
+                    continue
 
-            self.log(path, distance, print_type=PrintType.DEBUG)
+                shortest = INFINITY
+                for j in middle:
+                    bit = 1 << (j - 1)
+                    if unvisited & bit:
+                        shortest = min(shortest, distances[i][j] + remaining[unvisited ^ bit][j])
+
+                remaining[unvisited][i] = shortest
+
+        # Follow the lowest numbered target that stays on a shortest path
+        smallest = remaining[all_visited][0]
+        min_path = [targets[0]]
+        current = 0
+        unvisited = all_visited
+
+        while unvisited:
+            for j in middle:
+                bit = 1 << (j - 1)
+                if unvisited & bit and \
+                   distances[current][j] + remaining[unvisited ^ bit][j] == remaining[unvisited][current]:
+                    min_path.append(targets[j])
+                    current = j
+                    unvisited ^= bit
+                    break
 
-            if smallest is None or distance < smallest:
-                smallest = distance
-                min_path = list(path).copy()
+        min_path.append(targets[last])
 
         if self.debug:
             end_time = time.time()
@@ -1465,74 +1660,163 @@ class ItemRoutingSystem:
         Returns:
             path (list of tuples): List of item positions to traverse in order.
         """
+        return self.dijkstra_multi(grid, start, [target])[target]
+
+    def dijkstra_multi(self, grid, start, targets, deadline=None):
+        """
+        Performs dijkstra’s algorithm once to gather shortest paths to several desired
+        positions within the given grid, stopping when every position has been reached.
+
+        Since every step within the grid has the same cost, the search is done breadth-first.
+
+        Args:
+            grid(list of lists): Positions of items within the grid.
+
+            start (tuple): Position to search from.
+
+            targets (list of tuples): Positions of items to search for.
+
+            deadline (float): Optional `time.monotonic()` value to stop searching at.
+
+        Returns:
+            results (dict): Path and cost to each target, keyed by target position.
+                            Targets that cannot be reached have an empty path and cost of None.
+        """
 
         def is_valid_position(x, y):
             return 0 <= x < self.map_x and \
                    0 <= y < self.map_y
 
-        x, y = target
-        if not is_valid_position(x, y):
-            self.log(f"Invalid target position: {target}", print_type=PrintType.MINOR)
-            return [], None
+        # Positions are stored in flat lists indexed by ((x + 1) * width + (y + 1)),
+        # surrounded by a border of blocked positions so neighbors never leave the map
+        width = self.map_y + 2
+
+        def get_path(index):
+            path = []
+            while index != start_index:
+                path.append((index // width - 1, index % width - 1))
+                index = prev[index]
+            path.append(start)
+            path.reverse()
+
+            return path
+
+        # Paths are cached until the map is regenerated. The map is also edited in place
+        # (update_worker_position, labeling ordered items), which keeps the cache valid
+        # only because those edits never add or remove items, the only blocked positions.
+        # Any in-place edit of item positions must regenerate the map instead.
+        if grid is not self.path_cache_map:
+            self.path_cache = {}
+            self.path_cache_map = grid
+            self.blocked_positions = self.get_blocked_positions(grid)
+
+        # Cached paths are keyed by the start and target indices packed into one integer
+        size = len(self.blocked_positions)
+        start_index = (start[0] + 1) * width + (start[1] + 1)
+
+        results = {}
+        remaining = {}
+
+        for target in targets:
+            x, y = target
+            if not is_valid_position(x, y):
+                self.log("Invalid target position:", target, print_type=PrintType.MINOR)
+                results[target] = [], None
+                continue
+
+            index = (x + 1) * width + (y + 1)
+            cached = self.path_cache.get(start_index * size + index)
+
+            if cached is not None:
+                results[target] = cached
+            else:
+                remaining[index] = target
 
-        # Initialize the distance to all positions to infinity and to the starting position to 0
-        dist = {(i, j): float('inf') for i in range(self.map_x) for j in range(self.map_y)}
-        dist[start] = 0
+        if not remaining:
+            return results
 
-        # Initialize the priority queue with the starting position
-        pq = [(0, start)]
+        # Every move costs the same, so positions are reached in order of distance
+        # by a breadth-first search without needing a priority queue.
+        # Blocked positions are treated as already visited.
+        visited = bytearray(self.blocked_positions)
+        visited[start_index] = 1
 
-        # Initialize the previous position dictionary
-        prev = {}
-        total_cost = 0
+        # Initialize the previous position list
+        prev = [None] * len(visited)
 
-        while pq:
-            # Get the position with the smallest distance from the priority queue
-            (cost, position) = heapq.heappop(pq)
+        # Neighbor offsets for up, down, right and left
+        offsets = (1, -1, width, -width)
 
-            # If we've found the target, we're done
-            if position == target:
-                self.log(f"Found path to target {target} with cost {cost}!", print_type=PrintType.MINOR)
-                total_cost = cost
+        # Initialize the positions to search with the starting position
+        frontier = [start_index]
+        cost = 0
+
+        while frontier and remaining:
+            # Maximum Routing Time Check
+            if deadline is not None and time.monotonic() > deadline:
+                self.log(f"Timed out searching for {list(remaining.values())}", print_type=PrintType.DEBUG)
                 break
 
-            # Check the neighbors of the current position
-            for (dx, dy) in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                x, y = position[0] + dx, position[1] + dy
+            next_frontier = []
 
-                self.log(position, (x, y), print_type=PrintType.MINOR)
+            # Visit positions of equal distance in sorted order, matching a
+            # priority queue ordered by (cost, position)
+            frontier.sort()
 
-                if not is_valid_position(x, y):
-                    self.log(f"Skipping {(x, y)}: Invalid Position", print_type=PrintType.MINOR)
-                    continue
+            for index in frontier:
+                # If we've found a target, we're done once all targets are found
+                if index in remaining:
+                    target = remaining.pop(index)
+                    path = get_path(index)
+                    self.log(f"Path found with cost {cost}:", path, print_type=PrintType.MINOR)
 
-                if grid[x][y] == ItemRoutingSystem.ITEM_SYMBOL:
-                    self.log(f"Skipping {(x, y)}: Item", print_type=PrintType.MINOR)
-                    continue
+                    results[target] = path, cost
+                    self.path_cache[start_index * size + index] = path, cost
 
-                # Compute the distance to the neighbor
-                neighbor_cost = cost + 1
+                    if not remaining:
+                        break
 
-                # Update the distance and previous position if we've found a shorter path
-                if neighbor_cost < dist[(x, y)]:
-                    dist[(x, y)] = neighbor_cost
-                    prev[(x, y)] = position
-                    heapq.heappush(pq, (neighbor_cost, (x, y)))
+                # Record the previous position the first time a neighbor is reached
+                for offset in offsets:
+                    neighbor = index + offset
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        prev[neighbor] = index
+                        next_frontier.append(neighbor)
 
-        # Reconstruct the path
-        path = []
-        while position != start:
-            path.append(position)
-            position = prev[position]
-        path.append(start)
-        path.reverse()
-
-        if target in path:
-            self.log(f"Path found with cost {total_cost}: {path}", print_type=PrintType.MINOR)
-            return path, total_cost
-        else:
-            self.log("Path not found", print_type=PrintType.DEBUG)
-            return [], None
+            frontier = next_frontier
+            cost += 1
+
+        for index, target in remaining.items():
+            results[target] = [], None
+
+            # Only remember unreachable targets when the search was not cut short
+            if not frontier:
+                self.log(f"Path not found to {target}", print_type=PrintType.DEBUG)
+                self.path_cache[start_index * size + index] = [], None
+
+        return results
+
+    def get_blocked_positions(self, grid):
+        """
+        Marks positions within the grid that cannot be walked through.
+
+        Args:
+            grid(list of lists): Positions of items within the grid.
+
+        Returns:
+            blocked (bytearray): 1 for items and the border around the grid, 0 otherwise,
+                                 indexed by ((x + 1) * (map_y + 2) + (y + 1)).
+        """
+        width = self.map_y + 2
+        blocked = bytearray(b'\x01' * ((self.map_x + 2) * width))
+
+        for x in range(self.map_x):
+            for y in range(self.map_y):
+                if grid[x][y] != ItemRoutingSystem.ITEM_SYMBOL:
+                    blocked[(x + 1) * width + (y + 1)] = 0
+
+        return blocked
 
     def get_targets(self):
         """
@@ -1548,9 +1832,7 @@ class ItemRoutingSystem:
         targets = []
 
         if self.inserted_order:
-            targets = self.inserted_order.copy()
-            targets.insert(0, self.starting_position)
-            targets.append(self.ending_position)
+            targets = [self.starting_position, *self.inserted_order, self.ending_position]
 
         if self.debug:
             end_time = time.time()
@@ -1624,68 +1906,72 @@ class ItemRoutingSystem:
             path (list of str): List of English directions worker should take to gather
                                 all items from starting position.
         """
-        def is_at_access_point_to_target(position, target):
-            is_right = (position[0] + 1) == target[0] and (position[1] == target[1])
-            is_left  = (position[0] - 1) == target[0] and (position[1] == target[1])
-            is_above = (position[0]) == target[0] and (position[1] + 1 == target[1])
-            is_below = (position[0]) == target[0] and (position[1] - 1 == target[1])
+        def remove_duplicates(positions):
+            prev_position = None
+            for position in positions:
+                if prev_position == position:
+                    continue
 
-            return is_right or is_left or is_above or is_below
+                prev_position = position
+                yield position
 
-        if products:
-            _products = deepcopy(products)
-            if "Start" in _products:
-                _products.remove("Start")
-            if "End" in _products:
-                _products.remove("End")
+        # Local names for lookups repeated every step
+        move_to_target = self.move_to_target
+        product_info = self.product_info
 
-        _positions = deepcopy(positions)
+        if products:
+            # Products ordered from each target position
+            target_products = {}
+            for product in products:
+                if product != "Start" and product != "End":
+                    target_products.setdefault(product_info[product], []).append(product)
+
+        # Access points next to each target position, first listed target takes priority
+        access_points = {}
+        for target in targets:
+            for (dx, dy) in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                access_points.setdefault((target[0] + dx, target[1] + dy), target)
 
         if collapse:
-            updated_positions = self.collapse_directions(_positions)
+            updated_positions = iter(self.collapse_directions(positions))
         # Manually remove duplicates
         else:
-            prev_position = None
-            updated_positions = []
-            for position in _positions:
-                if prev_position == position:
-                    continue
-
-                prev_position = position
-                updated_positions.append(position)
+            updated_positions = remove_duplicates(positions)
 
-        start = updated_positions.pop(0)
-        end = updated_positions.pop()
+        start = next(updated_positions)
 
         path = []
-        path.append(f"Start at position {start}!")
+        append = path.append
+        append(f"Start at position {start}!")
         current_position = start
         total_steps = 0
 
+        # Last position is only known once the positions run out
+        end = next(updated_positions, start)
+
         # Preprocessing
-        for position in updated_positions:
-            prev_position = current_position
-            move, steps = self.move_to_target(current_position, position)
+        for next_position in updated_positions:
+            position, end = end, next_position
+
+            move, steps = move_to_target(current_position, position)
             current_position = position
             total_steps += steps
-            path.append(move)
+            append(move)
 
             # At Access Point for target position
-            for target in targets:
-                if is_at_access_point_to_target(position, target):
-                    if products:
-                        for product in _products:
-                            if self.product_info[product] == target:
-                                path.append(f"Pickup item {product} at {self.product_info[product]}.")
-                    else:
-                        path.append(f"Pickup item at {target}.")
-                    break
+            target = access_points.get(position)
+            if target is not None:
+                if products:
+                    for product in target_products.get(target, []):
+                        append(f"Pickup item {product} at {product_info[product]}.")
+                else:
+                    append(f"Pickup item at {target}.")
 
-        back_to_start, steps = self.move_to_target(current_position, end)
+        back_to_start, steps = move_to_target(current_position, end)
         total_steps += steps
-        path.append(back_to_start)
-        path.append("Pickup completed.")
-        path.append(f"Total Steps: {total_steps}")
+        append(back_to_start)
+        append("Pickup completed.")
+        append(f"Total Steps: {total_steps}")
 
         self.log(f"Total Steps: {total_steps}", print_type=PrintType.MINOR)
 
@@ -1725,41 +2011,93 @@ class ItemRoutingSystem:
             shortest_path = []
 
             # Maximum Routing Time Setup
-            timeout = False
-            t_temp = 0.0
-            t_thresh = self.maximum_routing_time
-            t_start = time.time()
+            deadline = time.monotonic() + self.maximum_routing_time
 
-            # Run Dijkstra's for every position next to the target item
+            # Only open positions next to the target item can be used to pick it up.
+            # Unreachable targets would keep the search running over the whole map.
+            access_points = []
             for (dx, dy) in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                # Maximum Routing Time Check
-                t_temp += time.time() - t_start
-                if (t_temp >= t_thresh):
-                    timeout = True
-                    shortest_path = path
-                    break
-
                 x, y = target[0] + dx, target[1] + dy
 
-                path, _ = self.dijkstra(self.map, self.starting_position, (x, y))
+                if 0 <= x < self.map_x and 0 <= y < self.map_y and \
+                   self.map[x][y] != ItemRoutingSystem.ITEM_SYMBOL:
+                    access_points.append((x, y))
+
+            # Search from both the starting and ending positions, meeting at the positions next to the target item
+            paths = self.dijkstra_multi(self.map, self.starting_position, access_points, deadline)
+            return_paths = self.dijkstra_multi(self.map, self.ending_position, access_points, deadline)
+
+            # Maximum Routing Time Check
+            timeout = time.monotonic() > deadline
+
+            # Choose the access point with the shortest total trip, preferring
+            # access points that can also reach the ending position
+            shortest_cost = None
+            for access_point in access_points:
+                path, cost = paths[access_point]
+                return_path, return_cost = return_paths[access_point]
+
+                # An empty return leg means the ending position can't be reached from the
+                # access point, or the search ran out of time. Only use the route without it
+                # when the ending position is unreachable, never a route cut short by the deadline.
+                if path and (return_path or not timeout):
+                    total_cost = (not return_path, cost + (return_cost or 0))
 
-                if path:
-                    if len(path) < len(shortest_path) or not shortest_path:
-                        shortest_path = path
+                    if shortest_cost is None or total_cost < shortest_cost:
+                        shortest_cost = total_cost
 
-                self.log(f"Shortest Path for {(x, y)}: {shortest_path}", print_type=PrintType.DEBUG)
+                        # Collapse each leg separately to keep the access point as a step
+                        shortest_path = self.collapse_directions(path)
+                        if return_path:
+                            shortest_path += self.collapse_directions(return_path[::-1])[1:]
+
+                self.log(f"Shortest Path for {access_point}:", shortest_path, print_type=PrintType.DEBUG)
 
             result = []
             if shortest_path:
                 self.log(f"Path to product is: {shortest_path}", print_type=PrintType.DEBUG)
-                path, _ = self.dijkstra(self.map, shortest_path[-1], self.ending_position)
-                shortest_path = shortest_path + path[1:]
-                result = self.get_descriptive_steps(shortest_path, [target])
+                result = self.get_descriptive_steps(shortest_path, [target], collapse=False)
             elif timeout:
                 path = [self.starting_position, target, self.ending_position]
                 result = self.get_descriptive_steps(path, [target])
             return result
 
+    def choose_setting(self, menu_type, choices):
+        """
+        Displays a settings menu until the user picks one of its choices or Back.
+
+        Args:
+            menu_type (MenuType): Settings menu to display.
+            choices (dict): Setting value for each menu option. The option after the
+                            last choice is Back.
+
+        Returns:
+            setting: Setting value of the chosen option, None if the user chose Back.
+        """
+        update = True
+        clear = True
+        back_option = str(len(choices) + 1)
+
+        while True:
+            if update:
+                self.display_menu(menu_type, clear=clear)
+            else:
+                update = True
+                clear = True
+
+            option = input("> ")
+
+            if option in choices:
+                return choices[option]
+
+            elif option == back_option:
+                return None
+
+            else:
+                self.log("Invalid choice. Try again.\n")
+                update = False
+                clear = False
+
     def verify_settings_range(self, value, minimum, maximum, expected_type=int):
         """
         Helper function to validate the value is within the specified range.
@@ -1975,30 +2313,18 @@ class ItemRoutingSystem:
         elif self.item_mode == GenerateMode.RANDOM:
             number_of_items = random.randint(self.minimum_items, self.maximum_items)
 
-            for _ in range(number_of_items):
-                success = False
-                while not success:
-                    x = random.randint(0, self.map_x - 1)
-                    y = random.randint(0, self.map_y - 1)
-
-                    position = (x, y)
-
-                    # Repeat Item Position
-                    if position in item_positions:
-                        self.log("Repeat item position! Please Try Again.\n", print_type=PrintType.DEBUG)
+            # Draw every item at once from the cells not taken by the worker,
+            # rather than retrying random coordinates until one is free
+            worker_positions = {self.starting_position, self.ending_position}
+            free_positions = [(x, y) for x in range(self.map_x) for y in range(self.map_y)
+                              if (x, y) not in worker_positions]
 
-                    # Overlapping Item and Worker Positions
-                    elif position == self.starting_position:
-                        self.log("Item position is the same as the starting worker position! Please Try Again.\n",
-                                 print_type=PrintType.DEBUG)
+            if number_of_items > len(free_positions):
+                self.log(f"Only {len(free_positions)} free positions for {number_of_items} items, "
+                         f"generating {len(free_positions)} items.", print_type=PrintType.DEBUG)
+                number_of_items = len(free_positions)
 
-                    elif position == self.ending_position:
-                        self.log("Item position is the same as the ending worker position! Please Try Again.\n",
-                                 print_type=PrintType.DEBUG)
-
-                    else:
-                        item_positions.append(position)
-                        success = True
+            item_positions = random.sample(free_positions, number_of_items)
 
         elif self.item_mode == GenerateMode.MANUAL:
             banner = Menu("Set Item Starting Position")
@@ -2018,6 +2344,9 @@ class ItemRoutingSystem:
                 self.log("Failed to set number of items in range.")
                 return []
 
+            # Set mirror of item_positions so repeat checks don't scan the list
+            placed = set()
+
             for item in range(int(number_of_items)):
                 x_success = False
                 y_success = False
@@ -2036,7 +2365,7 @@ class ItemRoutingSystem:
                     if x_success and y_success:
 
                         # Repeat Item Position
-                        if position in item_positions:
+                        if position in placed:
                             self.log("Repeat item position! Please Try Again.\n")
 
                         # Overlapping Item and Worker Positions
@@ -2047,6 +2376,7 @@ class ItemRoutingSystem:
 
                         else:
                             item_positions.append(position)
+                            placed.add(position)
 
                     else:
                         self.log("Invalid position! Please Try Again!\n")
@@ -2119,163 +2449,200 @@ class ItemRoutingSystem:
 
     def handle_option(self, option):
         """
-        Handles menu options for main application and corresponding submenus.
+        Handles menu options for main application by dispatching to the handler
+        of the chosen option.
 
         Args:
             option (str): Choice user chooses from main menu.
         """
-        # View Map
+        handler = self.option_handlers.get(option)
+
+        if handler:
+            handler()
+        else:
+            self.log("Invalid choice. Try again.\n")
+
+    def handle_view_map(self):
+        """
+        Handles the view map option and its submenus.
+        """
         update = True
         clear = True
 
-        if option == '1':
-            # Load product file if one hasn't been loaded yet
-            if self.product_file is None:
-                if update:
-                    self.display_menu(MenuType.LOAD_PRODUCT_FILE, clear=clear)
-                else:
-                    update = True
-                    clear = True
+        # Load product file if one hasn't been loaded yet
+        if self.product_file is None:
+            if update:
+                self.display_menu(MenuType.LOAD_PRODUCT_FILE, clear=clear)
+            else:
+                update = True
+                clear = True
 
-                # Set Product File Name
-                success = False
-                while not success:
-                    product_file = input("Enter product filename (full path to file): ")
+            # Set Product File Name
+            success = False
+            while not success:
+                product_file = input("Enter product filename (full path to file): ")
 
-                    success, reason = self.load_product_file(product_file.rstrip())
+                success, reason = self.load_product_file(product_file.rstrip())
 
-                    if success:
-                        self.item_mode = GenerateMode.LOADED_FILE
-                        self.items = self.get_item_positions()
-                        self.map, self.inserted_order = self.generate_map()
+                if success:
+                    self.item_mode = GenerateMode.LOADED_FILE
+                    self.items = self.get_item_positions()
+                    self.map, self.inserted_order = self.generate_map()
 
-                    elif reason == FileNotFoundError:
-                        self.log(f"File '{product_file}' was not found, please try entering full path to file!\n")
-                    elif reason == ValueError:
-                        self.log(f"File '{product_file}' is the incorrect format, please try changing the format or try a new file!\n")
-                    else:
-                        self.log(f"Something went wrong with '{product_file}', please try again!\n")
+                elif reason == FileNotFoundError:
+                    self.log(f"File '{product_file}' was not found, please try entering full path to file!\n")
+                elif reason == ValueError:
+                    self.log(f"File '{product_file}' is the incorrect format, please try changing the format or try a new file!\n")
+                else:
+                    self.log(f"Something went wrong with '{product_file}', please try again!\n")
+
+        # Display map after file is loaded
+        if update:
+            self.display_map()
+        else:
+            update = True
 
-            # Display map after file is loaded
+        # Don't clear for first View Map Menu
+        clear = False
+
+        while True:
+            # Create View Map menu
             if update:
-                self.display_map()
+                self.display_menu(MenuType.VIEW_MAP, clear=clear)
+
+                if self.order:
+                    order = []
+                    for product in self.order:
+                        if product == "Start" or product == "End":
+                            continue
+                        else:
+                            order.append(str(product))
+
+                    self.log(f"Current Order is: {', '.join(order)}")
             else:
                 update = True
+                clear = True
 
-            # Don't clear for first View Map Menu
-            clear = False
+            # Handle menu options
+            suboption = input("> ")
 
-            while True:
-                # Create View Map menu
-                if update:
-                    self.display_menu(MenuType.VIEW_MAP, clear=clear)
+            # Create Order
+            if suboption == '1':
+                clear = True
+                order_success = True
 
-                    if self.order:
-                        order = []
-                        for product in self.order:
-                            if product == "Start" or product == "End":
-                                continue
-                            else:
-                                order.append(str(product))
+                while True:
+                    if update:
+                        self.display_menu(MenuType.CREATE_ORDER, clear=clear)
+                    else:
+                        update = True
+                        clear = True
 
-                        self.log(f"Current Order is: {', '.join(order)}")
-                else:
-                    update = True
-                    clear = True
+                    # Handle menu options
+                    order_option = input("> ")
 
-                # Handle menu options
-                suboption = input("> ")
+                    order = []
+                    product_ids = []
+                    item_positions = []
 
-                # Create Order
-                if suboption == '1':
-                    clear = True
-                    order_success = True
+                    if self.debug:
+                        self.log_product_ids()
 
-                    while True:
-                        if update:
-                            self.display_menu(MenuType.CREATE_ORDER, clear=clear)
-                        else:
-                            update = True
-                            clear = True
+                    # Individual Order
+                    if order_option == "1":
+                        self.log("Order uses comma-separated Product IDs.\n" \
+                                 "Example:\n" \
+                                 "  1, 34, 50"
+                                )
 
-                        # Handle menu options
-                        order_option = input("> ")
+                        success = False
+                        while not success:
+                            order = input("Enter Order ('c' to cancel): ").rstrip()
 
-                        order = []
-                        product_ids = []
-                        item_positions = []
+                            if "c" in order:
+                                success = True
 
-                        if self.debug:
-                            self.log("Product IDs:")
-                            for i, product in enumerate(self.product_info, 1):
-                                self.log(f"{i}. {product}")
+                                self.log(f"Cancelled Order!")
+                                if self.order:
+                                    self.log(f"  Using current order:")
+                                    for i, product in enumerate(self.order):
+                                        self.log(f"  {i}. {product}")
 
-                        # Individual Order
-                        if order_option == "1":
-                            self.log("Order uses comma-separated Product IDs.\n" \
-                                     "Example:\n" \
-                                     "  1, 34, 50"
-                                    )
 
-                            success = False
-                            while not success:
-                                order = input("Enter Order ('c' to cancel): ").rstrip()
+                                continue
+                                # Do Nothing
 
-                                if "c" in order:
-                                    success = True
+                            elif order:
+                                try:
+                                    if "," in order:
+                                        order_list = order.split(", ")
+                                    else:
+                                        order_list = [int(order)]
 
-                                    self.log(f"Cancelled Order!")
-                                    if self.order:
-                                        self.log(f"  Using current order:")
-                                        for i, product in enumerate(self.order):
-                                            self.log(f"  {i}. {product}")
+                                    # More items than maximum allowed
+                                    if len(order_list) > self.maximum_items:
+                                        self.log(f"{len(order_list)} is more than the maximum number of items allowed of {self.maximum_items}!\n")
+                                        success = False
+                                        clear = False
 
+                                    # Valid list, get IDs
+                                    else:
+                                        for product_id in order_list:
+                                            if int(product_id) in self.product_info:
+                                                product_ids.append(int(product_id))
+                                                success = True
 
-                                    continue
-                                    # Do Nothing
+                                            else:
+                                                success = False
+                                                clear = False
+                                                product_ids = []
+                                                self.log(f"Product '{product_id}' is not within inventory. Not including in path.")
 
-                                elif order:
-                                    try:
-                                        if "," in order:
-                                            order_list = order.split(", ")
-                                        else:
-                                            order_list = [int(order)]
+                                    # Update algorithm depending on length of order
+                                    if len(product_ids) <= 5:
+                                        self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.BRANCH_AND_BOUND}")
+                                        self.tsp_algorithm = AlgoMethod.BRANCH_AND_BOUND
+                                    else:
+                                        self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR}")
+                                        self.tsp_algorithm = AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR
 
-                                        # More items than maximum allowed
-                                        if len(order_list) > self.maximum_items:
-                                            self.log(f"{len(order_list)} is more than the maximum number of items allowed of {self.maximum_items}!\n")
-                                            success = False
-                                            clear = False
+                                except ValueError:
+                                    self.log(f"Invalid order '{order}'! Please use the specified order format.")
 
-                                        # Valid list, get IDs
-                                        else:
-                                            for product_id in order_list:
-                                                if int(product_id) in self.product_info:
-                                                    product_ids.append(int(product_id))
-                                                    success = True
-
-                                                else:
-                                                    success = False
-                                                    clear = False
-                                                    product_ids = []
-                                                    self.log(f"Product '{product_id}' is not within inventory. Not including in path.")
-
-                                        # Update algorithm depending on length of order
-                                        if len(product_ids) <= 5:
-                                            self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.BRANCH_AND_BOUND}")
-                                            self.tsp_algorithm = AlgoMethod.BRANCH_AND_BOUND
-                                        else:
-                                            self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR}")
-                                            self.tsp_algorithm = AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR
 
-                                    except ValueError:
-                                        self.log(f"Invalid order '{order}'! Please use the specified order format.")
+                    # Multiple Orders from File
+                    elif order_option == "2":
+                        product_ids = []
+                        if self.order_file is None:
+                            # Set Order File Name
+                            success = False
+                            while not success:
+                                order_file = input("Enter order filename (full path to file): ")
+
+                                success, reason = self.load_order_file(order_file.rstrip())
+
+                                if success:
+                                    self.log(f"Successfully loaded orders from file '{order_file}'!")
+                                    self.order_number = 0
+                                    product_ids = self.order_info[self.order_number]
+                                    self.log(f"Loaded Order #{self.order_number}!")
+
+                                elif reason == FileNotFoundError:
+                                    self.log(f"File '{order_file}' was not found, please try entering full path to file!\n")
+                                elif reason == ValueError:
+                                    self.log(f"File '{order_file}' is the incorrect format, please try changing the format or try a new file!\n")
+                                else:
+                                    self.log(f"Something went wrong with '{order_file}', please try again!\n")
 
+                        self.display_menu(MenuType.MULTIPLE_ORDERS, clear=clear)
 
-                        # Multiple Orders from File
-                        elif order_option == "2":
-                            product_ids = []
-                            if self.order_file is None:
+                        ordering = True
+                        while ordering:
+                            mult_option = input("> ")
+
+                            ordering = False
+
+                            if mult_option == "1":
                                 # Set Order File Name
                                 success = False
                                 while not success:
@@ -2296,816 +2663,715 @@ class ItemRoutingSystem:
                                     else:
                                         self.log(f"Something went wrong with '{order_file}', please try again!\n")
 
-                            self.display_menu(MenuType.MULTIPLE_ORDERS, clear=clear)
-
-                            ordering = True
-                            while ordering:
-                                mult_option = input("> ")
+                            elif mult_option == "2":
+                                self.log(f"Current Order is #{self.order_number}, continuing to next order.")
+                                if len(self.order_info) > 0 and self.order_number < len(self.order_info):
+                                    self.order_number  = (self.order_number + 1) % len(self.order_info)
+                                    product_ids = self.order_info[self.order_number]
+                                    self.log(f"Using Order #{self.order_number}!")
 
-                                ordering = False
-
-                                if mult_option == "1":
-                                    # Set Order File Name
-                                    success = False
-                                    while not success:
-                                        order_file = input("Enter order filename (full path to file): ")
+                            elif mult_option == "3":
+                                success = False
+                                while not success:
+                                    order_number = input(f"Enter order number (0 - {len(self.order_info) - 1}): ")
 
-                                        success, reason = self.load_order_file(order_file.rstrip())
+                                    try:
+                                        order_number = int(order_number)
+                                        if len(self.order_info) > 0 and order_number < len(self.order_info):
+                                            product_ids = self.order_info[order_number]
+                                            self.order_number  = order_number
+                                            success = True
+                                        else:
+                                            self.log(f"Invalid order number '{order_number}'. Please try entering a number under {len(self.order_info)}.")
 
-                                        if success:
-                                            self.log(f"Successfully loaded orders from file '{order_file}'!")
-                                            self.order_number = 0
-                                            product_ids = self.order_info[self.order_number]
-                                            self.log(f"Loaded Order #{self.order_number}!")
+                                    except ValueError:
+                                        self.log(f"Invalid order number '{order_number}'. Please try entering a number under {len(self.order_info)}.")
 
-                                        elif reason == FileNotFoundError:
-                                            self.log(f"File '{order_file}' was not found, please try entering full path to file!\n")
-                                        elif reason == ValueError:
-                                            self.log(f"File '{order_file}' is the incorrect format, please try changing the format or try a new file!\n")
-                                        else:
-                                            self.log(f"Something went wrong with '{order_file}', please try again!\n")
+                            elif mult_option == "4":
+                                # Update algorithm depending on length of order
+                                if product_ids:
+                                    if len(product_ids) <= 5:
+                                        self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.BRANCH_AND_BOUND}")
+                                        self.tsp_algorithm = AlgoMethod.BRANCH_AND_BOUND
+                                    else:
+                                        self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR}")
+                                        self.tsp_algorithm = AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR
 
-                                elif mult_option == "2":
-                                    self.log(f"Current Order is #{self.order_number}, continuing to next order.")
-                                    if len(self.order_info) > 0 and self.order_number < len(self.order_info):
-                                        self.order_number  = (self.order_number + 1) % len(self.order_info)
-                                        product_ids = self.order_info[self.order_number]
-                                        self.log(f"Using Order #{self.order_number}!")
-
-                                elif mult_option == "3":
-                                    success = False
-                                    while not success:
-                                        order_number = input(f"Enter order number (0 - {len(self.order_info) - 1}): ")
-
-                                        try:
-                                            order_number = int(order_number)
-                                            if len(self.order_info) > 0 and order_number < len(self.order_info):
-                                                product_ids = self.order_info[order_number]
-                                                self.order_number  = order_number
-                                                success = True
-                                            else:
-                                                self.log(f"Invalid order number '{order_number}'. Please try entering a number under {len(self.order_info)}.")
+                                continue
 
-                                        except ValueError:
-                                            self.log(f"Invalid order number '{order_number}'. Please try entering a number under {len(self.order_info)}.")
+                            else:
+                                self.log(f"Invalid option '{mult_option}'! Please try again.\n")
+                                ordering = True
 
-                                elif mult_option == "4":
-                                    # Update algorithm depending on length of order
-                                    if product_ids:
-                                        if len(product_ids) <= 5:
-                                            self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.BRANCH_AND_BOUND}")
-                                            self.tsp_algorithm = AlgoMethod.BRANCH_AND_BOUND
-                                        else:
-                                            self.log(f"Number of items in the order is {len(product_ids)}, setting algorithm to {AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR}")
-                                            self.tsp_algorithm = AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR
+                    # Back
+                    elif order_option == "3":
+                        clear = True
+                        break
 
-                                    continue
+                    else:
+                        self.log(f"Invalid option '{order_option}'. Please try again.\n")
+                        order_success = False
+                        clear = False
 
-                                else:
-                                    self.log(f"Invalid option '{mult_option}'! Please try again.\n")
-                                    ordering = True
+                    if product_ids:
+                        items = "items" if len(product_ids) > 1 else "item"
+                        self.log(f"\n",
+                                 f"You completed your order of {len(product_ids)} {items}!\n",
+                                 f"You ordered:")
 
-                        # Back
-                        elif order_option == "3":
-                            clear = True
-                            break
+                        for i, product in enumerate(product_ids, 1):
+                            self.log(f"  {i}. {product}")
+                            item_positions.append(self.product_info[product])
 
-                        else:
-                            self.log(f"Invalid option '{order_option}'. Please try again.\n")
-                            order_success = False
-                            clear = False
+                        # Only the labeled positions change, so save just those
+                        original_positions = [(x, y, self.map[x][y]) for (x, y) in item_positions]
 
-                        if product_ids:
-                            items = "items" if len(product_ids) > 1 else "item"
-                            self.log(f"\n",
-                                     f"You completed your order of {len(product_ids)} {items}!\n",
-                                     f"You ordered:")
+                        # Label ordered items
+                        for position in item_positions:
+                            x, y = position
+                            self.map[x][y] = ItemRoutingSystem.ORDERED_ITEM_SYMBOL
 
-                            for i, product in enumerate(product_ids, 1):
-                                self.log(f"  {i}. {product}")
-                                item_positions.append(self.product_info[product])
+                        self.display_map()
 
-                            original_map = deepcopy(self.map)
+                        # Restore Original Map before any search, cached paths assume the map's items are unchanged
+                        for x, y, symbol in original_positions:
+                            self.map[x][y] = symbol
 
-                            # Label ordered items
-                            for position in item_positions:
-                                x, y = position
-                                self.map[x][y] = ItemRoutingSystem.ORDERED_ITEM_SYMBOL
+                        self.order = self.process_order(product_ids)
+                        self.graph = self.build_graph_for_order(self.order)
 
-                            self.display_map()
+                    # Go back to View Map Menu
+                    clear = False
 
-                            # Restore Original Map
-                            self.map = deepcopy(original_map)
+                    if order_success:
+                        break
 
-                            self.order = self.process_order(product_ids)
-                            self.graph = self.build_graph_for_order(self.order)
+            # Get Path for Order
+            elif suboption == '2':
+                if self.order:
+                    # Reuses the cached graph unless the map or worker positions changed
+                    self.graph = self.build_graph_for_order(self.order)
+
+                    # Locations are looked up alongside the graph, since another product file
+                    # may have been loaded since the order was created
+                    target_locations = []
+                    for product in self.order:
+                        if product == 'Start' or product == 'End':
+                            continue
 
-                        # Go back to View Map Menu
-                        clear = False
+                        location = self.product_info.get(product)
+                        if location:
+                            target_locations.append(location)
 
-                        if order_success:
-                            break
+                    # Reuse the route found for this order unless the graph or routing settings changed
+                    route_key = (tuple(self.order), self.bnb_access_type, self.maximum_routing_time)
+                    route = self.route_cache.get(route_key)
 
-                # Get Path for Order
-                elif suboption == '2':
-                    if self.order:
-                        if self.graph is None:
-                            self.graph = self.build_graph_for_order(self.order)
+                    if route is not None:
+                        cost, id_path, path, run_time = route
 
+                    else:
                         cost, id_path, path, run_time = self.run_tsp_algorithm(self.graph, self.order)
 
-                        # Algo Timed Out
-                        if run_time == self.maximum_routing_time:
+                        # Algo Timed Out before finding any path, the best path found so far is kept otherwise
+                        if run_time == self.maximum_routing_time and cost is None:
                             cost, id_path, path, run_time = self.run_tsp_algorithm(self.graph, self.order, AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR, rerun=True)
 
+                        # Timed out routes may improve with another try, so only finished routes are kept
+                        if run_time != self.maximum_routing_time:
+                            self.route_cache[route_key] = cost, id_path, path, run_time
 
-                        target_locations = []
-                        for product in self.order:
-                            if product == 'Start' or product == 'End':
-                                continue
-
-                            location = self.product_info.get(product)
-                            if location:
-                                target_locations.append(location)
-
+                    # Nothing to describe when no path was found
+                    steps = []
+                    if path:
                         steps = self.get_descriptive_steps(path, target_locations, products=self.order, collapse=False)
 
-                        if steps:
-                            self.display_path_in_map(steps)
+                    if steps:
+                        self.display_path_in_map(steps)
 
-                            self.log("Directions:")
-                            self.log("-----------")
-                            for step, action in enumerate(steps, 1):
-                                if "Total Steps" in action:
-                                    self.log(action)
-                                else:
-                                    self.log(f"{step}. {action}")
-
-                        else:
-                            self.log(f"Path to {product_id} was not found!")
+                        self.log_directions(steps)
 
                     else:
-                        self.log("No existing order! Please create an order first!")
-                        clear = False
+                        self.log("Path to your order was not found!")
 
-                # Get Path to Product
-                elif suboption == '3':
-                    self.log("Get Path to Product")
+                else:
+                    self.log("No existing order! Please create an order first!")
+                    clear = False
 
-                    # Request Product ID to find path for
-                    complete = False
-                    success = True
-                    while not complete:
-                        try:
-                            if self.debug:
-                                self.log("Product IDs:")
-                                for i, product in enumerate(self.product_info, 1):
-                                    self.log(f"{i}. {product}")
+            # Get Path to Product
+            elif suboption == '3':
+                self.log("Get Path to Product")
 
-                            product_id = input("Enter Product ID: ")
-                            item_position = self.product_info[int(product_id)]
+                # Request Product ID to find path for
+                complete = False
+                success = True
+                while not complete:
+                    try:
+                        if self.debug:
+                            self.log_product_ids()
 
-                            complete = True
+                        product_id = input("Enter Product ID: ")
+                        item_position = self.product_info[int(product_id)]
 
-                        except ValueError:
-                            self.log(f"Invalid Product ID '{product_id}', please try again!\n")
+                        complete = True
 
-                        except KeyError:
-                            self.log("Product was not found!\n")
-                            success = False
-                            complete = True
+                    except ValueError:
+                        self.log(f"Invalid Product ID '{product_id}', please try again!\n")
 
-                    if success:
-                        steps = self.get_items(self.gathering_algo, item_position)
+                    except KeyError:
+                        self.log("Product was not found!\n")
+                        success = False
+                        complete = True
 
-                        if steps:
-                            self.display_path_in_map(steps)
+                if success:
+                    steps = self.get_items(self.gathering_algo, item_position)
 
-                            self.log("Directions:")
-                            self.log("-----------")
-                            for step, action in enumerate(steps, 1):
-                                    if "Total Steps" in action:
-                                        self.log(action)
-                                    else:
-                                        self.log(f"{step}. {action}")
-                        else:
-                            self.log(f"Path to {product_id} was not found!")
+                    if steps:
+                        self.display_path_in_map(steps)
 
-                    clear = False
-
-                # Get Location of Product
-                elif suboption == '4':
-                    self.log("Get Location of Product")
-
-                    complete = False
-                    while not complete:
-                        try:
-                            if self.debug:
-                                self.log("Product IDs:")
-                                for i, product in enumerate(self.product_info, 1):
-                                    self.log(f"{i}. {product}")
-
-                            product_id = input("Enter Product ID: ")
+                        self.log_directions(steps)
+                    else:
+                        self.log(f"Path to {product_id} was not found!")
 
-                            self.log(
-                                f"Product `{product_id}` is located at position {self.product_info[int(product_id)]}.")
-                            complete = True
+                clear = False
 
-                        except ValueError:
-                            self.log(f"Invalid Product ID '{product_id}', please try again!\n")
+            # Get Location of Product
+            elif suboption == '4':
+                self.log("Get Location of Product")
 
-                        except KeyError:
-                            self.log("Product was not found!\n")
-                            complete = True
+                complete = False
+                while not complete:
+                    try:
+                        if self.debug:
+                            self.log_product_ids()
 
-                # Back
-                elif suboption == '5':
-                    # Debug Mode: Generate New Map
-                    if self.debug:
-                        self.log("Generate New Map")
-                        self.items = self.get_item_positions()
-                        self.map, self.inserted_order = self.generate_map()
-                        self.display_map()
+                        product_id = input("Enter Product ID: ")
 
-                        clear = False
+                        self.log(
+                            f"Product `{product_id}` is located at position {self.product_info[int(product_id)]}.")
+                        complete = True
 
-                    # Normal Mode: Back
-                    else:
-                        break
+                    except ValueError:
+                        self.log(f"Invalid Product ID '{product_id}', please try again!\n")
 
-                # Debug Mode: Back
-                elif suboption == '6' and self.debug:
-                    break
+                    except KeyError:
+                        self.log("Product was not found!\n")
+                        complete = True
 
-                else:
-                    self.log("Invalid choice. Try again.\n")
-                    update = False
+            # Back
+            elif suboption == '5':
+                # Debug Mode: Generate New Map
+                if self.debug:
+                    self.log("Generate New Map")
+                    self.items = self.get_item_positions()
+                    self.map, self.inserted_order = self.generate_map()
+                    self.display_map()
 
-        # Settings
-        elif option == '2':
-            clear = True
+                    clear = False
 
-            while True:
-                # Create Settings Menu
-                if update:
-                    self.display_menu(MenuType.SETTINGS, clear=clear)
-                    clear = True
+                # Normal Mode: Back
                 else:
-                    update = True
-
-                # Handle Settings Menu Options
-                suboption = input("> ")
+                    break
 
-                # Load Product File
-                if suboption == '1':
-                    if update:
-                        self.display_menu(MenuType.LOAD_PRODUCT_FILE, clear=clear)
-                    else:
-                        update = True
-                        clear = True
+            # Debug Mode: Back
+            elif suboption == '6' and self.debug:
+                break
 
-                    # Set Product File Name
-                    success = False
-                    while not success:
-                        product_file = input("Enter product filename (full path to file): ")
+            else:
+                self.log("Invalid choice. Try again.\n")
+                update = False
 
-                        success, reason = self.load_product_file(product_file.rstrip())
+    def handle_settings(self):
+        """
+        Handles the settings option and its submenus.
+        """
+        update = True
+        clear = True
 
-                        if success:
-                            self.item_mode = GenerateMode.LOADED_FILE
-                            self.items = self.get_item_positions()
+        while True:
+            # Create Settings Menu
+            if update:
+                self.display_menu(MenuType.SETTINGS, clear=clear)
+                clear = True
+            else:
+                update = True
 
-                            # Set new map parameters
-                            max_x = self.map_x
-                            max_y = self.map_y
+            # Handle Settings Menu Options
+            suboption = input("> ")
 
-                            for item in self.items:
-                                x, y = item
-                                if x > max_x:
-                                    max_x = x
-                                if y > max_y:
-                                    max_y = y
+            # Load Product File
+            if suboption == '1':
+                if update:
+                    self.display_menu(MenuType.LOAD_PRODUCT_FILE, clear=clear)
+                else:
+                    update = True
+                    clear = True
 
-                            self.map_x = max_x + 1
-                            self.map_y = max_y + 1
+                # Set Product File Name
+                success = False
+                while not success:
+                    product_file = input("Enter product filename (full path to file): ")
 
-                            self.map, self.inserted_order = self.generate_map()
+                    success, reason = self.load_product_file(product_file.rstrip())
 
-                        elif reason == FileNotFoundError:
-                            self.log(f"File '{product_file}' was not found, please try entering full path to file!\n")
-                        elif reason == ValueError:
-                            self.log(f"File '{product_file}' is the incorrect format, please try changing the format or try a new file!\n")
-                        else:
-                            self.log(f"Something went wrong with '{product_file}', please try again!\n")
+                    if success:
+                        self.item_mode = GenerateMode.LOADED_FILE
+                        self.items = self.get_item_positions()
 
-                # Set Worker Starting Position
-                elif suboption == '2':
-                    while True:
-                        if update:
-                            self.display_menu(MenuType.WORKER_START_POSITION, clear=clear)
-                        else:
-                            update = True
-                            clear = True
+                        # Set new map parameters
+                        max_x = self.map_x
+                        max_y = self.map_y
 
-                        # Give Worker Mode options in debug mode
-                        if self.debug:
-                            mode_option = input(f"Set Worker Position Mode (Currently {self.worker_mode}): ")
+                        for item in self.items:
+                            x, y = item
+                            if x > max_x:
+                                max_x = x
+                            if y > max_y:
+                                max_y = y
 
-                            # Set random starting position
-                            if mode_option == '1':
-                                self.worker_mode = GenerateMode.RANDOM
+                        self.map_x = max_x + 1
+                        self.map_y = max_y + 1
 
-                                self.set_worker_starting_position()
+                        self.map, self.inserted_order = self.generate_map()
 
-                                # Generate map with new starting position
-                                self.map, self.inserted_order = self.generate_map()
-                                break
+                    elif reason == FileNotFoundError:
+                        self.log(f"File '{product_file}' was not found, please try entering full path to file!\n")
+                    elif reason == ValueError:
+                        self.log(f"File '{product_file}' is the incorrect format, please try changing the format or try a new file!\n")
+                    else:
+                        self.log(f"Something went wrong with '{product_file}', please try again!\n")
 
-                            # Set manual starting position
-                            elif mode_option == '2':
-                                self.worker_mode = GenerateMode.MANUAL
+            # Set Worker Starting Position
+            elif suboption == '2':
+                while True:
+                    if update:
+                        self.display_menu(MenuType.WORKER_START_POSITION, clear=clear)
+                    else:
+                        update = True
+                        clear = True
 
-                                self.set_worker_starting_position()
+                    # Give Worker Mode options in debug mode
+                    if self.debug:
+                        mode_option = input(f"Set Worker Position Mode (Currently {self.worker_mode}): ")
 
-                                # Generate map with new starting position
-                                self.map, self.inserted_order = self.generate_map()
-                                break
+                        # Set random starting position
+                        if mode_option == '1':
+                            self.worker_mode = GenerateMode.RANDOM
 
-                            # Back
-                            elif mode_option == '3':
-                                break
+                            previous_position = self.starting_position
+                            self.set_worker_starting_position()
 
-                            else:
-                                self.log("Invalid choice. Try again.\n")
-                                update = False
-                                clear = False
+                            # Update map with new starting position
+                            self.update_worker_position(previous_position)
+                            break
 
-                        # Normal case, always request user input
-                        else:
+                        # Set manual starting position
+                        elif mode_option == '2':
                             self.worker_mode = GenerateMode.MANUAL
 
+                            previous_position = self.starting_position
                             self.set_worker_starting_position()
 
-                            # Generate map with new starting position
-                            self.map, self.inserted_order = self.generate_map()
-
-                            # Go back to Settings menu
+                            # Update map with new starting position
+                            self.update_worker_position(previous_position)
                             break
 
-                    clear = False
+                        # Back
+                        elif mode_option == '3':
+                            break
 
-                # Set Worker Ending Position
-                elif suboption == '3':
-                    while True:
-                        if update:
-                            self.display_menu(MenuType.WORKER_ENDING_POSITION, clear=clear)
                         else:
-                            update = True
-                            clear = True
-
-                        # Give Worker Mode options in debug mode
-                        if self.debug:
-                            mode_option = input(f"Set Worker Position Mode (Currently {self.worker_mode}): ")
+                            self.log("Invalid choice. Try again.\n")
+                            update = False
+                            clear = False
 
-                            # Set random starting position
-                            if mode_option == '1':
-                                self.worker_mode = GenerateMode.RANDOM
+                    # Normal case, always request user input
+                    else:
+                        self.worker_mode = GenerateMode.MANUAL
 
-                                self.set_worker_ending_position()
+                        previous_position = self.starting_position
+                        self.set_worker_starting_position()
 
-                                # Generate map with new starting position
-                                self.map, self.inserted_order = self.generate_map()
-                                break
+                        # Update map with new starting position
+                        self.update_worker_position(previous_position)
 
-                            # Set manual starting position
-                            elif mode_option == '2':
-                                self.worker_mode = GenerateMode.MANUAL
+                        # Go back to Settings menu
+                        break
 
-                                self.set_worker_ending_position()
+                clear = False
 
-                                # Generate map with new starting position
-                                self.map, self.inserted_order = self.generate_map()
-                                break
+            # Set Worker Ending Position
+            elif suboption == '3':
+                while True:
+                    if update:
+                        self.display_menu(MenuType.WORKER_ENDING_POSITION, clear=clear)
+                    else:
+                        update = True
+                        clear = True
 
-                            # Back
-                            elif mode_option == '3':
-                                break
+                    # Give Worker Mode options in debug mode
+                    if self.debug:
+                        mode_option = input(f"Set Worker Position Mode (Currently {self.worker_mode}): ")
 
-                            else:
-                                self.log("Invalid choice. Try again.\n")
-                                update = False
-                                clear = False
-
-                        # Normal case, always request user input
-                        else:
-                            self.worker_mode = GenerateMode.MANUAL
+                        # Set random starting position
+                        if mode_option == '1':
+                            self.worker_mode = GenerateMode.RANDOM
 
+                            previous_position = self.ending_position
                             self.set_worker_ending_position()
 
-                            # Generate map with new starting position
-                            self.map, self.inserted_order = self.generate_map()
-
-                            # Go back to Settings menu
+                            # Update map with new ending position
+                            self.update_worker_position(previous_position)
                             break
 
-                    clear = False
-
-
-                # Set Maximum Items Ordered Amount
-                elif suboption == '4':
-                    self.set_maximum_items_ordered()
-                    self.items = self.get_item_positions()
-
-                    clear = False
+                        # Set manual starting position
+                        elif mode_option == '2':
+                            self.worker_mode = GenerateMode.MANUAL
 
-                elif suboption == '5':
-                    self.set_maximum_routing_time()
+                            previous_position = self.ending_position
+                            self.set_worker_ending_position()
 
-                    clear = False
+                            # Update map with new ending position
+                            self.update_worker_position(previous_position)
+                            break
 
-                # Toggle Debug
-                elif suboption == '6':
-                    self.debug = not self.debug
+                        # Back
+                        elif mode_option == '3':
+                            break
 
-                # Debug Mode:       Advanced Settings
-                # Non-Debug Mode:   Back
-                elif suboption == '7':
-                    # Debug Mode: Advanced Settings
-                    if self.debug:
-                        while True:
-                            if update:
-                                self.display_menu(MenuType.ADVANCED_SETTINGS, clear=clear)
-                            else:
-                                update = True
-                                clear = True
+                        else:
+                            self.log("Invalid choice. Try again.\n")
+                            update = False
+                            clear = False
 
-                            adv_option = input("> ")
+                    # Normal case, always request user input
+                    else:
+                        self.worker_mode = GenerateMode.MANUAL
 
-                            # Set Map Size
-                            if adv_option == '1':
-                                clear = self.set_map_size()
-                                self.map, self.inserted_order = self.generate_map()
+                        previous_position = self.ending_position
+                        self.set_worker_ending_position()
 
-                            # Set Item Position Mode
-                            elif adv_option == '2':
-                                while True:
-                                    if update:
-                                        self.display_menu(MenuType.ITEM_POSITION, clear=clear)
-                                    else:
-                                        update = True
-                                        clear = True
+                        # Update map with new ending position
+                        self.update_worker_position(previous_position)
 
-                                    mode_option = input(f"Set Item Position Mode (Currently {self.item_mode}): ")
+                        # Go back to Settings menu
+                        break
 
-                                    # Set random starting position
-                                    if mode_option == '1':
-                                        self.item_mode = GenerateMode.RANDOM
+                clear = False
 
-                                        self.items = self.get_item_positions()
 
-                                        # Generate map with new item positions
-                                        self.map, self.inserted_order = self.generate_map()
-                                        break
+            # Set Maximum Items Ordered Amount
+            elif suboption == '4':
+                self.set_maximum_items_ordered()
+                self.items = self.get_item_positions()
 
-                                    # Set manual starting position
-                                    elif mode_option == '2':
-                                        self.item_mode = GenerateMode.MANUAL
+                clear = False
 
-                                        self.items = self.get_item_positions()
+            elif suboption == '5':
+                self.set_maximum_routing_time()
 
-                                        # Generate map with new item positions
-                                        self.map, self.inserted_order = self.generate_map()
-                                        break
+                clear = False
 
-                                    # Back
-                                    elif mode_option == '3':
-                                        break
+            # Toggle Debug
+            elif suboption == '6':
+                self.debug = not self.debug
 
-                                    else:
-                                        self.log("Invalid choice. Try again.\n")
-                                        update = False
-                                        clear = False
+            # Debug Mode:       Advanced Settings
+            # Non-Debug Mode:   Back
+            elif suboption == '7':
+                # Debug Mode: Advanced Settings
+                if self.debug:
+                    while True:
+                        if update:
+                            self.display_menu(MenuType.ADVANCED_SETTINGS, clear=clear)
+                        else:
+                            update = True
+                            clear = True
 
-                            # Set Map Orientation
-                            elif adv_option == '3':
-                                print("Set Map Orientation is currently under development!")
-                                update = False
-                                clear = False
-
-                            # Set Gather Algorithm Method
-                            elif adv_option == '4':
-                                while True:
-                                    if update:
-                                        self.display_menu(MenuType.GATHER_ALGO_METHOD, clear=clear)
-                                    else:
-                                        update = True
-                                        clear = True
+                        adv_option = input("> ")
 
-                                    algo_option = input("> ")
+                        # Set Map Size
+                        if adv_option == '1':
+                            clear = self.set_map_size()
+                            self.map, self.inserted_order = self.generate_map()
 
-                                    # Order of Insertion
-                                    if algo_option == '1':
-                                        self.gathering_algo = AlgoMethod.ORDER_OF_INSERTION
-                                        break
+                        # Set Item Position Mode
+                        elif adv_option == '2':
+                            while True:
+                                if update:
+                                    self.display_menu(MenuType.ITEM_POSITION, clear=clear)
+                                else:
+                                    update = True
+                                    clear = True
 
-                                    # Brute Force
-                                    elif algo_option == '2':
-                                        self.gathering_algo = AlgoMethod.BRUTE_FORCE
-                                        break
+                                mode_option = input(f"Set Item Position Mode (Currently {self.item_mode}): ")
 
-                                    # Dijkstra
-                                    elif algo_option == '3':
-                                        self.gathering_algo = AlgoMethod.DIJKSTRA
-                                        break
+                                # Set random starting position
+                                if mode_option == '1':
+                                    self.item_mode = GenerateMode.RANDOM
 
-                                    # Back
-                                    elif algo_option == '4':
-                                        break
+                                    self.items = self.get_item_positions()
 
-                                    else:
-                                        self.log("Invalid choice. Try again.\n")
-                                        update = False
-                                        clear = False
+                                    # Generate map with new item positions
+                                    self.map, self.inserted_order = self.generate_map()
+                                    break
 
-                            # Set TSP Algorithm Method
-                            elif adv_option == '5':
-                                while True:
-                                    if update:
-                                        self.display_menu(MenuType.TSP_ALGO_METHOD, clear=clear)
-                                    else:
-                                        update = True
-                                        clear = True
+                                # Set manual starting position
+                                elif mode_option == '2':
+                                    self.item_mode = GenerateMode.MANUAL
 
-                                    algo_option = input("> ")
+                                    self.items = self.get_item_positions()
 
-                                    # Branch and Bound
-                                    if algo_option == '1':
-                                        self.tsp_algorithm = AlgoMethod.BRANCH_AND_BOUND
-                                        break
+                                    # Generate map with new item positions
+                                    self.map, self.inserted_order = self.generate_map()
+                                    break
 
-                                    # Custom Algorithm
-                                    elif algo_option == '2':
-                                        self.tsp_algorithm = AlgoMethod.LOCALIZED_MIN_PATH
-                                        break
+                                # Back
+                                elif mode_option == '3':
+                                    break
 
-                                    # Repetitive Nearest Neighbor
-                                    elif algo_option == '3':
-                                        self.tsp_algorithm = AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR
-                                        break
+                                else:
+                                    self.log("Invalid choice. Try again.\n")
+                                    update = False
+                                    clear = False
+
+                        # Set Map Orientation
+                        elif adv_option == '3':
+                            print("Set Map Orientation is currently under development!")
+                            update = False
+                            clear = False
 
-                                    # Back
-                                    elif algo_option == '4':
-                                        break
+                        # Set Gather Algorithm Method
+                        elif adv_option == '4':
+                            algo_method = self.choose_setting(MenuType.GATHER_ALGO_METHOD,
+                                                              ItemRoutingSystem.GATHER_ALGO_OPTIONS)
+                            if algo_method:
+                                self.gathering_algo = algo_method
+
+                        # Set TSP Algorithm Method
+                        elif adv_option == '5':
+                            algo_method = self.choose_setting(MenuType.TSP_ALGO_METHOD,
+                                                              ItemRoutingSystem.TSP_ALGO_OPTIONS)
+                            if algo_method:
+                                self.tsp_algorithm = algo_method
+
+                        # Set TSP Access Type
+                        elif adv_option == '6':
+                            access_type = self.choose_setting(MenuType.TSP_ACCESS_TYPE,
+                                                              ItemRoutingSystem.TSP_ACCESS_OPTIONS)
+                            if access_type:
+                                self.bnb_access_type = access_type
+
+                        # Load Test Case File
+                        elif adv_option == '7':
+                            if update:
+                                self.display_menu(MenuType.LOAD_TEST_CASE_FILE, clear=clear)
+                            else:
+                                update = True
+                                clear = True
 
-                                    else:
-                                        self.log("Invalid choice. Try again.\n")
-                                        update = False
-                                        clear = False
+                            # Set Product File Name
+                            success = False
+                            while not success:
+                                test_case_file = input("Enter test case filename (full path to file): ")
 
-                            # Set TSP Access Type
-                            elif adv_option == '6':
-                                while True:
-                                    if update:
-                                        self.display_menu(MenuType.TSP_ACCESS_TYPE, clear=clear)
-                                    else:
-                                        update = True
-                                        clear = True
+                                success, reason = self.load_test_case_file(test_case_file.rstrip())
 
-                                    algo_option = input("> ")
+                                if success:
+                                    self.test_case_file = test_case_file
 
-                                    # Branch and Bound
-                                    if algo_option == '1':
-                                        self.bnb_access_type = AccessType.SINGLE_ACCESS
-                                        break
+                                    if self.debug:
+                                        for test_case in self.test_cases:
+                                            size, ids = test_case
+                                            self.log(size, ids, print_type=PrintType.MINOR)
 
-                                    # Custom Algorithm
-                                    elif algo_option == '2':
-                                        self.bnb_access_type = AccessType.MULTI_ACCESS
-                                        break
+                                elif reason == FileNotFoundError:
+                                    self.log(f"File '{test_case_file}' was not found, please try entering full path to file!\n")
+                                elif reason == ValueError:
+                                    self.log(f"File '{test_case_file}' is the incorrect format, please try changing the format or try a new file!\n")
+                                else:
+                                    self.log(f"Something went wrong with '{test_case_file}', please try again!\n")
 
-                                    # Back
-                                    elif algo_option == '3':
-                                        break
+                        # Run Test Cases
+                        elif adv_option == '8':
+                            if self.test_case_file and self.test_product_file:
+                                success, reason = self.load_product_file(self.test_product_file)
 
-                                    else:
-                                        self.log("Invalid choice. Try again.\n")
-                                        update = False
-                                        clear = False
+                                if not success:
+                                    self.log(f"Failed to load test case product file {self.test_product_file}!\n" \
+                                             f"Check if product file exists in correct location.\n"               \
+                                             f"Change path in loaded test case file as needed.\n")
 
-                            # Load Test Case File
-                            elif adv_option == '7':
-                                if update:
-                                    self.display_menu(MenuType.LOAD_TEST_CASE_FILE, clear=clear)
                                 else:
-                                    update = True
-                                    clear = True
+                                    # Generate Test Map
+                                    self.item_mode = GenerateMode.LOADED_FILE
+                                    self.items = self.get_item_positions()
+
+                                    # Set new map parameters
+                                    max_x = self.map_x
+                                    max_y = self.map_y
+
+                                    for item in self.items:
+                                        x, y = item
+                                        if x > max_x:
+                                            max_x = x
+                                        if y > max_y:
+                                            max_y = y
+
+                                    self.map_x = max_x + 1
+                                    self.map_y = max_y + 1
+
+                                    self.map, self.inserted_order = self.generate_map()
+
+                                    # Setup Test Case
+                                    passed = 0
+                                    failed = 0
+                                    cases_failed = {}
+
+                                    # Get Test System Information
+                                    system_info = {
+                                        "Machine": platform.machine(),
+                                        "Platform": platform.platform(),
+                                        "System": platform.system(),
+                                        "Kernel Version": platform.release()
+                                    }
+
+                                    self.log("\nSystem Information\n"\
+                                             "------------------")
+                                    for k, v in system_info.items():
+                                        self.log(f"{k}: \n\t{v}")
+                                    self.log("")
+
+                                    # Algorithms to run each test case against
+                                    algorithms_to_test = [
+                                        AlgoMethod.LOCALIZED_MIN_PATH,
+                                        AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR,
+                                        AlgoMethod.BRANCH_AND_BOUND
+                                    ]
+
+                                    # Banners printed before and after each algorithm runs, the same for every test case
+                                    banners = {}
+                                    for algo in algorithms_to_test:
+                                        algo_str = f"Running {algo}....."
+                                        if algo == AlgoMethod.BRANCH_AND_BOUND:
+                                            algo_str = f"Running {self.bnb_access_type} {algo}....."
+
+                                        running_line = "-------------------" + ('-' * len(algo_str))
+                                        completed_line = "-------------------" + ('-' * len(str(algo)))
+
+                                        banners[algo] = (f"{running_line}\n{algo_str}\n{running_line}",
+                                                         f"{completed_line}\nCompleted {algo}!\n{completed_line}")
+
+                                    # Run All Test Cases
+                                    for test_case in self.test_cases:
+                                        size, product_ids = test_case
+                                        cases_failed[size] = {}
+
+                                        # Test Algorithms to Get Paths
+                                        self.log(f"Test Case: Size {size}\n"    \
+                                                  "----------------------")
+                                        grouped_items = self.process_order(product_ids)
+                                        graph = self.build_graph_for_order(grouped_items)
+
+                                        # Locations of the ordered products, without the 'Start' and 'End' nodes
+                                        target_locations = [self.product_info[product] for product in grouped_items[1:-1]]
+
+
+                                        # Run Test Case against desired algorithms
+                                        for algo in algorithms_to_test:
+                                            running_banner, completed_banner = banners[algo]
+
+                                            # Run Algorithm
+                                            self.log(running_banner)
+                                            cost, id_path, path, run_time = self.run_tsp_algorithm(graph, grouped_items, algo)
+
+                                            # Algorithm Timed Out
+                                            if run_time == self.maximum_routing_time:
+                                                failed += 1
+                                                cases_failed[size][str(algo)] = f"Timeout: {path}"
+                                                self.log(f"Failed {algo}!")
 
-                                # Set Product File Name
-                                success = False
-                                while not success:
-                                    test_case_file = input("Enter test case filename (full path to file): ")
+                                            else:
+                                                # Test Case Finished
+                                                # Cells are strings, so copying each row is enough
+                                                test_map = [row[:] for row in self.map]
 
-                                    success, reason = self.load_test_case_file(test_case_file.rstrip())
+                                                steps = self.get_descriptive_steps(path, target_locations, products=grouped_items, collapse=False)
 
-                                    if success:
-                                        self.test_case_file = test_case_file
+                                                if steps:
+                                                    self.display_path_in_map(steps, map_layout=test_map, map_only=True)
 
-                                        if self.debug:
-                                            for test_case in self.test_cases:
-                                                size, ids = test_case
-                                                self.log(size, ids, print_type=PrintType.MINOR)
+                                                    self.log_directions(steps)
 
-                                    elif reason == FileNotFoundError:
-                                        self.log(f"File '{test_case_file}' was not found, please try entering full path to file!\n")
-                                    elif reason == ValueError:
-                                        self.log(f"File '{test_case_file}' is the incorrect format, please try changing the format or try a new file!\n")
-                                    else:
-                                        self.log(f"Something went wrong with '{test_case_file}', please try again!\n")
+                                                passed += 1
 
-                            # Run Test Cases
-                            elif adv_option == '8':
-                                if self.test_case_file and self.test_product_file:
-                                    success, reason = self.load_product_file(self.test_product_file)
+                                                self.log(completed_banner)
 
-                                    if not success:
-                                        self.log(f"Failed to load test case product file {self.test_product_file}!\n" \
-                                                 f"Check if product file exists in correct location.\n"               \
-                                                 f"Change path in loaded test case file as needed.\n")
+                                            self.log(f"    Time: {run_time:.6f}\n" \
+                                                     f"    Cost: {cost}\n"         \
+                                                     f"     IDs: {id_path}\n"      \
+                                                     f"    Path: {path}\n")
 
-                                    else:
-                                        # Generate Test Map
-                                        self.item_mode = GenerateMode.LOADED_FILE
-                                        self.items = self.get_item_positions()
-
-                                        # Set new map parameters
-                                        max_x = self.map_x
-                                        max_y = self.map_y
-
-                                        for item in self.items:
-                                            x, y = item
-                                            if x > max_x:
-                                                max_x = x
-                                            if y > max_y:
-                                                max_y = y
-
-                                        self.map_x = max_x + 1
-                                        self.map_y = max_y + 1
-
-                                        self.map, self.inserted_order = self.generate_map()
-
-                                        # Setup Test Case
-                                        passed = 0
-                                        failed = 0
-                                        cases_failed = {}
-
-                                        # Get Test System Information
-                                        system_info = {
-                                            "Machine": platform.machine(),
-                                            "Platform": platform.platform(),
-                                            "System": platform.system(),
-                                            "Kernel Version": platform.release()
-                                        }
-
-                                        self.log("\nSystem Information\n"\
-                                                 "------------------")
-                                        for k, v in system_info.items():
-                                            self.log(f"{k}: \n\t{v}")
-                                        self.log("")
-
-                                        # Run All Test Cases
-                                        for test_case in self.test_cases:
-                                            size, product_ids = test_case
-                                            cases_failed[size] = {}
-
-                                            # Test Algorithms to Get Paths
-                                            self.log(f"Test Case: Size {size}\n"    \
-                                                      "----------------------")
-                                            grouped_items = self.process_order(product_ids)
-                                            graph = self.build_graph_for_order(grouped_items)
-
-
-                                            # Run Test Case against desired algorithms
-                                            algorithms_to_test = [
-                                                AlgoMethod.LOCALIZED_MIN_PATH,
-                                                AlgoMethod.REPETITIVE_NEAREST_NEIGHBOR,
-                                                AlgoMethod.BRANCH_AND_BOUND
-                                            ]
-
-                                            for algo in algorithms_to_test:
-
-                                                algo_str = f"Running {algo}....."
-                                                if algo == AlgoMethod.BRANCH_AND_BOUND:
-                                                    algo_str = f"Running {self.bnb_access_type} {algo}....."
-
-                                                # Run Algorithm
-                                                self.log("-------------------" + ('-' * len(algo_str)))
-                                                self.log(algo_str)
-                                                self.log("-------------------" + ('-' * len(algo_str)))
-                                                cost, id_path, path, run_time = self.run_tsp_algorithm(graph, grouped_items, algo)
-
-                                                # Algorithm Timed Out
-                                                if run_time == self.maximum_routing_time:
-                                                    failed += 1
-                                                    cases_failed[size][str(algo)] = f"Timeout: {path}"
-                                                    self.log(f"Failed {algo}!")
-
-                                                else:
-                                                    # Test Case Finished
-                                                    test_map = deepcopy(self.map)
-
-                                                    target_locations = []
-                                                    for product in grouped_items:
-                                                        if product == 'Start' or product == 'End':
-                                                            continue
-
-                                                        location = self.product_info.get(product)
-                                                        if location:
-                                                            target_locations.append(location)
-
-                                                    steps = self.get_descriptive_steps(path, target_locations, products=grouped_items, collapse=False)
-
-                                                    if steps:
-                                                        self.display_path_in_map(steps, map_layout=test_map, map_only=True)
-
-                                                        self.log("Directions:")
-                                                        self.log("-----------")
-                                                        for step, action in enumerate(steps, 1):
-                                                            if "Total Steps" in action:
-                                                                self.log(action)
-                                                            else:
-                                                                self.log(f"{step}. {action}")
-
-                                                    passed += 1
-
-                                                    self.log("-------------------" + ('-' * len(str(algo))))
-                                                    self.log(f"Completed {algo}!")
-                                                    self.log("-------------------" + ('-' * len(str(algo))))
-
-                                                self.log(f"    Time: {run_time:.6f}")
-                                                self.log(f"    Cost: {cost}")
-                                                self.log(f"     IDs: {id_path}")
-                                                self.log(f"    Path: {path}")
-                                                self.log("")
-
-                                        self.log(f"Results\n"             \
-                                                 f"---------\n"           \
-                                                 f"Passed: {passed}\n"    \
-                                                 f"Failed: {failed}\n"    \
-                                                 f"Total:  {passed + failed}")
-                                        self.log("")
-
-                                        # Display Failures
-                                        if failed:
-                                            self.log("Failures\n" \
-                                                     "---------")
-                                            for size, fails in cases_failed.items():
-                                                if fails:
-                                                    self.log(f"{size}: ")
-                                                    for case, reason in fails.items():
-                                                        self.log(f"    {case}:")
-                                                        self.log(f"        {reason}")
+                                    self.log(f"Results\n"             \
+                                             f"---------\n"           \
+                                             f"Passed: {passed}\n"    \
+                                             f"Failed: {failed}\n"    \
+                                             f"Total:  {passed + failed}")
+                                    self.log("")
 
-                                else:
-                                    self.log("No test cases to run! Must load test case file first!")
+                                    # Display Failures
+                                    if failed:
+                                        self.log("Failures\n" \
+                                                 "---------")
+                                        for size, fails in cases_failed.items():
+                                            if fails:
+                                                self.log(f"{size}: ")
+                                                for case, reason in fails.items():
+                                                    self.log(f"    {case}:")
+                                                    self.log(f"        {reason}")
 
-                                update = True
-                                clear = False
+                            else:
+                                self.log("No test cases to run! Must load test case file first!")
 
-                            # Back
-                            elif adv_option == '9':
-                                break
+                            update = True
+                            clear = False
 
-                            else:
-                                self.log("Invalid choice. Try again.\n")
-                                update = False
-                                clear = False
+                        # Back
+                        elif adv_option == '9':
+                            break
 
-                    # Non-Debug Mode: Back
-                    else:
-                        break
+                        else:
+                            self.log("Invalid choice. Try again.\n")
+                            update = False
+                            clear = False
 
-                # Debug Mode: Back
-                elif suboption == '8' and self.debug:
+                # Non-Debug Mode: Back
+                else:
                     break
 
-                else:
-                    self.log("Invalid choice. Try again.\n")
-                    update = False
+            # Debug Mode: Back
+            elif suboption == '8' and self.debug:
+                break
 
-        # Exit
-        elif option == '3':
-            self.log("Exiting...")
-            sys.exit()
-        else:
-            self.log("Invalid choice. Try again.\n")
-            update = False
+            else:
+                self.log("Invalid choice. Try again.\n")
+                update = False
+
+    def handle_exit(self):
+        """
+        Handles the exit option.
+        """
+        self.log("Exiting...")
+        self.running = False
 
     def run(self):
         """
         Helper function to run the application. Loops the main menu until the user
         chooses to exit.
         """
-        while True:
+        self.running = True
+
+        while self.running:
             self.display_menu(MenuType.MAIN_MENU)
 
             choice = input("> ")
@@ -1,10 +1,49 @@
 import os
 
+
+def enable_ansi_escapes():
+    """
+    Makes sure the terminal understands ANSI escape sequences.
+
+    Windows consoles only process them once virtual terminal processing is turned on.
+
+    Returns:
+        success (bool): Status whether escape sequences can be written to the terminal.
+    """
+    if os.name != 'nt':
+        return True
+
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
 class Menu:
     """
     Displays menu options to screen.
     """
 
+    # Moves the cursor to the top left, then clears the screen and scrollback,
+    # the same sequence `clear` writes
+    CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+    BANNER = "------------------------------------------------------------"
+
+    # Whether CLEAR_SCREEN works in this terminal, checked on the first clear
+    ansi_clear = None
+
     def __init__(self, menu_name):
         """
         Initializes menu with a name and defaults to no options.
@@ -13,7 +52,11 @@ class Menu:
             menu_name (str): name of menu
         """
         self.menu_name = menu_name
+
+        # Menu names don't change, so the banner is only built once
+        self.banner_block = f"{Menu.BANNER}\n{menu_name.center(len(Menu.BANNER))}\n{Menu.BANNER}"
         self.options = []
+        self.options_block = None
         self.misc_info = None
 
     def print_banner(self):
@@ -26,10 +69,7 @@ class Menu:
                                         Menu
             ------------------------------------------------------------
         """
-        banner = "------------------------------------------------------------"
-        print(banner)
-        print(f"{self.menu_name.center(len(banner))}")
-        print(banner)
+        print(self.banner_block)
 
     def display(self, clear=True):
         """
@@ -48,36 +88,45 @@ class Menu:
             2. Option 2
 
         """
+        # Screen is written with a single print, starting with the clear sequence
+        output = self.banner_block
+
         if clear:
-            # Windows
-            if os.name == 'nt':
-                os.system('cls')
+            if Menu.ansi_clear is None:
+                Menu.ansi_clear = enable_ansi_escapes()
 
-            # Mac/Linus
-            else:
-                os.system('clear')
+            # Write the escape sequence directly instead of running `clear` or `cls`
+            if Menu.ansi_clear:
+                output = Menu.CLEAR_SCREEN + output
 
-        self.print_banner()
+            # Older Windows consoles without escape sequence support
+            else:
+                os.system('cls')
 
         if self.misc_info:
-            print(self.misc_info)
+            output += "\n" + self.misc_info
 
         if self.options:
-            print("")
-            for i, option in enumerate(self.options):
-                print(f"{i+1}. {option}")
-            print("")
+            # Numbered options only change when an option is added
+            if self.options_block is None:
+                numbered = "\n".join(f"{i+1}. {option}" for i, option in enumerate(self.options))
+                self.options_block = f"\n{numbered}\n"
+
+            output += "\n" + self.options_block
+
+        print(output)
 
-    def add_option(self, index, option):
+    def add_option(self, option):
         """
-        Inserts option to existing option list.
+        Appends option to existing option list. Options are numbered in the
+        order they are added.
 
         Args:
-            index  (int): Position of menu to insert option to.
             option (str): Option name or description.
 
         """
-        self.options.insert(index, option)
+        self.options.append(option)
+        self.options_block = None
 
     def set_misc_info(self, info):
         """